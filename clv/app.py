@@ -9,11 +9,14 @@ import json
 import os
 import re
 import shutil
+import stat
+from bisect import insort
 from collections import deque
 from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Iterable, Literal, Optional
+from typing import BinaryIO, Iterable, Literal, Optional
 from xml.dom import minidom
 
 from rich.console import Group, RenderableType
@@ -35,13 +38,13 @@ from textual.widgets import Input
 from textual.widget import MountError
 from textual.widgets._tree import TOGGLE_STYLE, TreeNode
 
-from .services import SourceManager, persist_log_sources
+from .services import SourceManager, path_sort_key, persist_log_sources
 from .storage import SessionState, StateStore
 from .widgets.add_source_dialog import AddSourceDialog
 from .widgets.advanced_drawer import AdvancedFiltersDrawer
 from .widgets.custom_time_dialog import CustomTimeRangeDialog
 from .widgets.filter_chip import FilterChip
-from .widgets.query_bar import QueryBar
+from .widgets.query_bar import REGEX_COUNT_MAX_LINES, QueryBar
 
 
 SEVERITY_SEGMENTS: list[tuple[str, str, str]] = [
@@ -60,7 +63,19 @@ SEVERITY_COLORS = {
     "DEBUG": "#a855f7",
 }
 
-REGEX_SAMPLE_LIMIT = 2000
+# Template settings shipped next to the package; resolved once at import.
+BUNDLED_SETTINGS_FILE = Path(__file__).resolve().parents[1] / "settings.conf"
+
+# The query bar counts hits in the newest REGEX_COUNT_MAX_LINES lines; the one
+# extra line only tells it more are buffered, so the count is shown as partial.
+REGEX_SAMPLE_LIMIT = REGEX_COUNT_MAX_LINES + 1
+RENDER_DEBOUNCE = 0.15
+# Filtered renders over at least this many buffered lines run in a worker thread.
+FILTER_THREAD_MIN_LINES = 5000
+# Idle polls before the tail interval doubles, and the slowest it may get.
+TAIL_IDLE_POLLS = 8
+TAIL_MAX_INTERVAL = 2.0
+TAIL_READ_BLOCK = 64 * 1024
 STRUCTURED_PAYLOAD_MAX_CHARS = 8_192
 CSV_ROWS_DEFAULT = 20
 CSV_COLS_DEFAULT = 10
@@ -73,6 +88,12 @@ LOG_LINE_RE = re.compile(
     r"^(?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(?:[.,]\d+)?) - (?P<level>\w+) - (?P<message>.*)$"
 )
 
+# timedelta keyword for each time-window shortcut suffix ("15m", "1h", "1d").
+TIMERANGE_UNITS = {"m": "minutes", "h": "hours", "d": "days"}
+
+# Longest fractional-second part a timestamp may carry (microseconds, as with strptime's %f).
+TIMESTAMP_FRACTION_DIGITS = 6
+
 SOURCES_PANEL_DEFAULT_WIDTH = 38
 SOURCES_PANEL_MIN_WIDTH = 24
 SOURCES_PANEL_MAX_WIDTH = 80
@@ -124,7 +145,7 @@ def get_config_file() -> Optional[Path]:
     if xdg_conf:
         return xdg_conf
 
-    dev_conf = Path(__file__).resolve().parents[1] / "settings.conf"
+    dev_conf = BUNDLED_SETTINGS_FILE
     if dev_conf.exists():
         return dev_conf
 
@@ -135,7 +156,7 @@ def _ensure_user_settings_file() -> Optional[Path]:
     """Ensure the per-user settings file exists; copy template defaults if needed."""
 
     target = get_xdg_config_home() / "clv" / "settings.conf"
-    template = Path(__file__).resolve().parents[1] / "settings.conf"
+    template = BUNDLED_SETTINGS_FILE
 
     if target.exists():
         return target
@@ -160,28 +181,38 @@ def _ensure_user_settings_file() -> Optional[Path]:
         return template if template.exists() else None
 
 
-def load_config() -> LogConfig:
+def _resolve_log_dirs(raw_dirs: str) -> tuple[Path, ...]:
+    """Expand and resolve the absolute entries of a comma-separated log_dirs value."""
+
+    entries = (entry.strip() for entry in raw_dirs.split(","))
+    normalized = (_normalize_dir(entry) for entry in entries if entry)
+    return tuple(log_dir for log_dir in normalized if log_dir is not None)
+
+
+def _normalize_dir(entry: str) -> Optional[Path]:
+    """Return the resolved directory for ``entry``, or None when it is not absolute."""
+
+    log_dir = Path(entry).expanduser()
+    if not log_dir.is_absolute():
+        return None
+    try:
+        return log_dir.resolve()
+    except FileNotFoundError:
+        return log_dir
+
+
+def load_config(path: Optional[Path] = None) -> LogConfig:
+    """Parse settings.conf; pass ``path`` when the caller already looked it up."""
+
+    if path is None:
+        path = get_config_file()
     config = configparser.ConfigParser()
-    path = get_config_file()
     if path:
         config.read(path)
     viewer = config["log_viewer"] if "log_viewer" in config else {}
 
     raw_dirs = viewer.get("log_dirs", "logs") if hasattr(viewer, "get") else "logs"
-    if isinstance(raw_dirs, str):
-        raw_dirs = [part.strip() for part in raw_dirs.split(",") if part.strip()]
-
-    log_dirs: list[Path] = []
-    for entry in raw_dirs:
-        path = Path(entry).expanduser()
-        if not path.is_absolute():
-            continue
-        try:
-            path = path.resolve()
-        except FileNotFoundError:
-            pass
-        log_dirs.append(path)
-
+    log_dirs = list(_resolve_log_dirs(raw_dirs))
     if not log_dirs:
         log_dirs = [Path.cwd() / "logs"]
 
@@ -226,25 +257,20 @@ def parse_timerange(shortcut: str) -> tuple[datetime, datetime]:
     if shortcut == "all":
         epoch = datetime.fromtimestamp(0)
         return epoch, now
-    if shortcut.endswith("m"):
-        minutes = int(shortcut[:-1])
-        return now - timedelta(minutes=minutes), now
-    if shortcut.endswith("h"):
-        hours = int(shortcut[:-1])
-        return now - timedelta(hours=hours), now
-    if shortcut.endswith("d"):
-        days = int(shortcut[:-1])
-        return now - timedelta(days=days), now
+    unit = TIMERANGE_UNITS.get(shortcut[-1:])
+    if unit:
+        return now - timedelta(**{unit: int(shortcut[:-1])}), now
     raise ValueError("Unsupported shortcut. Use values like '15m', '1h', '1d'.")
 
 
+@lru_cache(maxsize=32)
 def parse_datetime_range(range_str: str) -> Optional[tuple[datetime, datetime]]:
-    if "to" not in range_str:
+    start_str, separator, end_str = range_str.partition("to")
+    if not separator:
         return None
     try:
-        start_str, end_str = [segment.strip() for segment in range_str.split("to", 1)]
-        start = datetime.fromisoformat(start_str)
-        end = datetime.fromisoformat(end_str)
+        start = datetime.fromisoformat(start_str.strip())
+        end = datetime.fromisoformat(end_str.strip())
         return start, end
     except ValueError:
         return None
@@ -257,18 +283,48 @@ def parse_log_line(line: str) -> Optional[tuple[datetime, str, str]]:
     timestamp_str = match.group("timestamp")
     level = match.group("level")
     message = match.group("message")
-    timestamp: Optional[datetime] = None
-    for fmt in ("%Y-%m-%d %H:%M:%S,%f", "%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S"):
-        try:
-            timestamp = datetime.strptime(timestamp_str, fmt)
-            break
-        except ValueError:
-            continue
-    if timestamp is None:
+    # The regex already fixed the field positions, so slice them out instead of
+    # running strptime's format interpreter on every line.
+    fraction = timestamp_str[20:]
+    if len(fraction) > TIMESTAMP_FRACTION_DIGITS:
+        return None
+    try:
+        timestamp = datetime(
+            int(timestamp_str[0:4]),
+            int(timestamp_str[5:7]),
+            int(timestamp_str[8:10]),
+            int(timestamp_str[11:13]),
+            int(timestamp_str[14:16]),
+            int(timestamp_str[17:19]),
+            int(fraction.ljust(TIMESTAMP_FRACTION_DIGITS, "0")) if fraction else 0,
+        )
+    except ValueError:
         return None
     return timestamp, level.upper(), message
 
 
+@lru_cache(maxsize=128)
+def _compile_filter_regex(regex: str) -> Optional[re.Pattern[str]]:
+    """Compile ``regex`` once per distinct query; invalid patterns yield None."""
+
+    try:
+        return re.compile(regex)
+    except re.error:
+        return None
+
+
+def _parse_with_memo(
+    line: str, memo: dict[str, Optional[tuple[datetime, str, str]]]
+) -> Optional[tuple[datetime, str, str]]:
+    """parse_log_line, reusing (and recording) results in *memo*."""
+
+    try:
+        return memo[line]
+    except KeyError:
+        parsed = memo[line] = parse_log_line(line)
+        return parsed
+
+
 def filter_log_lines(
     lines: Iterable[str],
     *,
@@ -276,28 +332,68 @@ def filter_log_lines(
     regex: Optional[str] = None,
     start: Optional[datetime] = None,
     end: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    memo: Optional[dict[str, Optional[tuple[datetime, str, str]]]] = None,
 ) -> list[str]:
-    pattern = re.compile(regex) if regex else None
+    """Return the lines matching every given filter, stopping after ``limit`` matches.
+
+    Pass ``memo`` to reuse parse results across calls over the same buffer.
+    """
+
+    pattern = _compile_filter_regex(regex) if regex else None
+    search = pattern.search if pattern else None
+    level = level.upper() if level else None
+    unfiltered = search is None and level is None and start is None and end is None
+    if unfiltered:
+        # Nothing to test, so skip parsing every line.
+        return list(itertools.islice(lines, limit))
     filtered: list[str] = []
     for raw in lines:
-        parsed = parse_log_line(raw)
+        parsed = parse_log_line(raw) if memo is None else _parse_with_memo(raw, memo)
         if parsed is None:
-            if pattern is None and level is None and start is None and end is None:
-                filtered.append(raw)
             continue
         timestamp, severity, message = parsed
-        if level and severity != level.upper():
-            continue
-        if pattern and not pattern.search(message):
+        # Cheapest checks first; the user regex only runs on survivors.
+        if level and severity != level:
             continue
         if start and timestamp < start:
             continue
         if end and timestamp > end:
             continue
+        if search and not search(message):
+            continue
         filtered.append(raw)
+        if limit is not None and len(filtered) >= limit:
+            break
     return filtered
 
 
+def read_last_lines(path: Path, count: int) -> tuple[list[str], int]:
+    """Return the last *count* lines of *path* and the byte offset they end at.
+
+    Reads backwards in ``TAIL_READ_BLOCK`` steps so large logs are never loaded whole.
+    """
+
+    blocks: list[bytes] = []
+    newlines = 0
+    with path.open("rb") as handle:
+        end = handle.seek(0, os.SEEK_END)
+        position = end
+        while position > 0 and newlines <= count:
+            step = min(TAIL_READ_BLOCK, position)
+            position -= step
+            handle.seek(position)
+            block = handle.read(step)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+    blocks.reverse()
+    lines = b"".join(blocks).decode("utf-8", errors="ignore").splitlines()
+    if position > 0:
+        # The first line started before the bytes we read.
+        lines = lines[1:]
+    return lines[-count:], end
+
+
 class FilterChips(Container):
     COLUMN_ORDER: tuple[str, ...] = (
         "query",
@@ -460,7 +556,10 @@ class LogTree(Tree[Path]):
 class LogViewerApp(App[None]):
     CSS = """
     /* Root must be vertical so fractional heights propagate */
-    Screen { layout: vertical; }
+    Screen { layout: vertical; height: 100%; }
+
+    /* Cap the query band so it never squeezes the log panes */
+    #query-bar { max-height: 12; }
 
     #main-content {
         height: 1fr;
@@ -515,12 +614,12 @@ class LogViewerApp(App[None]):
     #query-grid > .row { layout: horizontal; height: auto; margin: 0; padding: 0; align: left middle; width: 1fr; }
     #query-grid > .row > LabeledField { width: 1fr; margin-right: 1; }
     #query-grid > .row > LabeledField:last-child { margin-right: 0; }
-    #time-row { align: left top; }
+    #query-grid > #time-row { align: left top; }
     #time-row > #time-controls { layout: horizontal; align: right top; height: auto; width: auto; }
     #time-spacer { width: 1fr; min-width: 0; }
     #time-controls > #auto-scroll-field { margin-right: 1; }
-    #auto-scroll-field { padding-top: 0; }
-    #actions-field { layout: horizontal; align: right top; height: auto; min-height: 3; padding: 1 0 0 0; }
+    #auto-scroll-field, #pretty-field { padding-top: 0; width: auto; }
+    #actions-field { layout: horizontal; align: right top; width: auto; height: auto; min-height: 3; padding: 1 0 0 0; }
     #actions-field Button { margin-left: 1; height: 3; min-height: 3; padding: 0 2; }
     #actions-field Button:first-child { margin-left: 0; }
     #actions-field Button#add-source { margin-left: 1; }
@@ -528,14 +627,14 @@ class LogViewerApp(App[None]):
     /* LabeledField sizing so children don't collapse */
     LabeledField { width: 1fr; min-width: 16; }
     LabeledField > .field-label { color: $text-muted; }
-    LabeledField > .field-control { height: auto; min-height: 3; width: 1fr; }
+    LabeledField > Container.field-control { height: auto; min-height: 3; width: 1fr; }
 
     /* Inputs span their grid cell */
     QueryBar Input { height: 3; width: 1fr; border: tall $surface 25%; background: $surface 8%; }
 
     /* Radios behave like buttons */
     QueryBar RadioSet { layout: horizontal; }
-    QueryBar #time-field { width: auto; }
+    QueryBar #time-row > #time-field { width: auto; }
     QueryBar #time-field .field-control { width: auto; layout: horizontal; align: left middle; content-align: left middle; height: auto; min-height: 3; padding: 0 1 0 1; margin: 0; }
     QueryBar #time-field RadioSet { width: auto; align: left middle; }
     QueryBar RadioButton {
@@ -556,7 +655,8 @@ class LogViewerApp(App[None]):
     QueryBar #severity-field SegmentedButtons { height: 3; width: 1fr; }
 
     /* Switch shouldn't stretch full width */
-    #auto-scroll-field .field-control { width: auto; }
+    #auto-scroll-field .field-control,
+    #pretty-field .field-control { width: auto; }
 
     .log-tree {
         background: $surface 6%;
@@ -703,8 +803,8 @@ class LogViewerApp(App[None]):
         super().__init__()
         self._persist_state = False
         self._store = StateStore()
-        self._config = load_config()
         config_path = get_config_file()
+        self._config = load_config(config_path)
         if config_path is None:
             config_path = get_xdg_config_home() / "clv" / "settings.conf"
         self._settings_path = config_path
@@ -718,9 +818,17 @@ class LogViewerApp(App[None]):
         self._discovery_summary: DiscoverySummary | None = None
         self._suppress_tree_selection = True
         self._raw_lines: deque[str] = deque(maxlen=self._config.max_buffer_lines)
+        # Parse results for the selected source's lines, reused across re-renders.
+        self._parsed_lines: dict[str, Optional[tuple[datetime, str, str]]] = {}
         self._tail_timer: Timer | None = None
+        self._tail_interval: float = 0.0
+        self._tail_idle_polls: int = 0
+        self._render_timer: Timer | None = None
+        self._render_generation = 0
         self._tail_offset: int = 0
-        self._tail_remainder: str = ""
+        self._tail_handle: Optional[BinaryIO] = None
+        self._tail_inode: int = 0
+        self._tail_remainder: bytes = b""
         self.query_bar = QueryBar()
         self.chip_bar = FilterChips(id="chip-bar")
         self.advanced_drawer = AdvancedFiltersDrawer()
@@ -747,29 +855,6 @@ class LogViewerApp(App[None]):
         discovery_summary = await self._populate_tree()
         self._apply_state()
         self._refresh_chips()
-        # ---- Force vertical stretch so Log panes never get squished ----
-        screen = self.screen
-        screen.styles.layout = "vertical"
-        screen.styles.height = "100%"
-        main = self.query_one("#main-content")
-        main.styles.layout = "horizontal"
-        main.styles.height = "1fr"
-
-        self.query_bar.styles.height = "auto"
-        self.query_bar.styles.max_height = 12
-        self.query_bar.styles.overflow_y = "hidden"
-
-        self.chip_bar.styles.max_height = 4
-        self.chip_bar.styles.height = "auto"
-        self.chip_bar.styles.overflow_y = "auto"
-
-        self.query_one("#sources-panel").styles.height = "1fr"
-        self.query_one("#viewer-panel").styles.height = "1fr"
-        tree_panel = self.query_one("#tree-panel")
-        tree_panel.styles.height = "1fr"
-        tree_panel.styles.overflow_y = "auto"
-        tree_panel.styles.overflow_x = "hidden"
-        tree_panel.styles.scrollbar_gutter = "stable"
         self._apply_sources_panel_width()
         self.log_panel.clear()
         self._write_discovery_summary(discovery_summary)
@@ -800,8 +885,7 @@ class LogViewerApp(App[None]):
             )
         else:
             self.query_bar.select_time(self.state.time_window)
-        switch = self.query_bar.query_one("#auto-scroll-toggle", Switch)
-        switch.value = self.state.auto_scroll
+        self.query_bar.set_auto_scroll(self.state.auto_scroll)
         self.log_panel.auto_scroll = self.state.auto_scroll
         self.query_bar.set_pretty_rendering(self.state.pretty_rendering)
         self._sync_regex_validation()
@@ -877,10 +961,35 @@ class LogViewerApp(App[None]):
     def _format_root_label(base: Path) -> str:
         return str(base)
 
+    @staticmethod
+    def _scan_readable_files(base: Path) -> list[tuple[str, Path]]:
+        """Walk *base* with scandir, returning ``(relative path, path)`` pairs sorted case-insensitively."""
+
+        root = os.fspath(base)
+        prefix_len = len(os.path.join(root, ""))
+        found: list[tuple[str, str]] = []
+        pending = [root]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif entry.is_file() and os.access(entry.path, os.R_OK):
+                                found.append((entry.path[prefix_len:], entry.path))
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        found.sort(key=lambda item: item[0].casefold())
+        return [(rel, Path(path)) for rel, path in found]
+
     def _populate_directory_tree(
         self,
         tree: LogTree,
         base: Path,
+        files: list[tuple[str, Path]],
         *,
         sources: set[Path],
         dir_accumulator: set[Path],
@@ -890,39 +999,31 @@ class LogViewerApp(App[None]):
         root.label = self._format_root_label(base)
         root.data = base
 
-        dir_nodes: dict[Path, TreeNode[Path]] = {base: root}
-
-        try:
-            candidates = list(base.rglob("*"))
-        except (OSError, PermissionError):
-            candidates = []
-
-        files: list[Path] = []
-        for candidate in candidates:
-            try:
-                if candidate.is_file() and os.access(candidate, os.R_OK):
-                    files.append(candidate)
-            except OSError:
-                continue
-
-        files.sort(key=lambda p: str(p.relative_to(base)).lower())
+        # Keyed by the directory's path relative to base, so each directory's
+        # node chain is built once rather than re-walked for every file in it.
+        dir_nodes: dict[str, TreeNode[Path]] = {"": root}
 
         count = 0
-        for file_path in files:
+        for rel, file_path in files:
             if base not in dir_accumulator:
                 dir_accumulator.add(base)
             count += 1
             sources.add(file_path)
-            rel = file_path.relative_to(base)
-            node = root
-            current = base
-            for part in rel.parts[:-1]:
-                current = current / part
-                dir_accumulator.add(current)
-                if current not in dir_nodes:
-                    dir_nodes[current] = node.add(part, data=current)
-                node = dir_nodes[current]
-            node.add_leaf(rel.name, data=file_path)
+            rel_dir, _, name = rel.rpartition(os.sep)
+            node = dir_nodes.get(rel_dir)
+            if node is None:
+                node = root
+                current = base
+                prefix = ""
+                for part in rel_dir.split(os.sep):
+                    prefix = f"{prefix}{os.sep}{part}" if prefix else part
+                    current = current / part
+                    child = dir_nodes.get(prefix)
+                    if child is None:
+                        child = dir_nodes[prefix] = node.add(part, data=current)
+                        dir_accumulator.add(current)
+                    node = child
+            node.add_leaf(name, data=file_path)
 
         if count:
             root.expand()
@@ -950,12 +1051,18 @@ class LogViewerApp(App[None]):
         total_files = 0
 
         session_dirs = self._source_manager.directories
-        for base in session_dirs:
+        # Walk every root in its own thread at once so a slow mount doesn't
+        # serialise the rest, and none of it stalls the UI.
+        scans = await asyncio.gather(
+            *(asyncio.to_thread(self._scan_readable_files, base) for base in session_dirs)
+        )
+        for base, files in zip(session_dirs, scans):
             tree = LogTree(self._format_root_label(base), classes="log-tree", base_path=base, role="directory")
             await panel.mount(tree)
             total_files += self._populate_directory_tree(
                 tree,
                 base,
+                files,
                 sources=sources,
                 dir_accumulator=discovered_dirs,
             )
@@ -974,7 +1081,7 @@ class LogViewerApp(App[None]):
             await panel.mount(Static("No log sources configured.", classes="empty-tree"))
 
         self._ensure_tree_focus()
-        self._sources = sorted(sources, key=lambda p: str(p).lower())
+        self._sources = sorted(sources, key=path_sort_key)
         configured_sources = len(session_dirs) + len(session_files)
         summary = DiscoverySummary(
             source_count=configured_sources,
@@ -1039,9 +1146,11 @@ class LogViewerApp(App[None]):
             self._tail_timer.stop()
             self._tail_timer = None
         self._selected_source = None
+        self._close_tail_handle()
         self._raw_lines.clear()
+        self._parsed_lines.clear()
         self._tail_offset = 0
-        self._tail_remainder = ""
+        self._tail_remainder = b""
         if self.state.selected_source:
             self._update_state(selected_source="")
 
@@ -1050,106 +1159,229 @@ class LogViewerApp(App[None]):
             resolved = path.resolve()
         except FileNotFoundError:
             return False
-        if not resolved.exists() or not resolved.is_file():
+        # One stat instead of exists() + is_file(); still refuse FIFOs and other
+        # special files, which would block read_last_lines on open.
+        try:
+            mode = resolved.stat().st_mode
+        except OSError:
+            return False
+        if not stat.S_ISREG(mode):
             return False
         if resolved not in self._sources:
-            self._sources.append(resolved)
-            self._sources.sort(key=lambda p: str(p).lower())
+            insort(self._sources, resolved, key=path_sort_key)
         self._selected_source = resolved
         try:
-            raw_text = resolved.read_text(encoding="utf-8", errors="ignore")
+            lines, end_offset = read_last_lines(resolved, self._config.max_buffer_lines)
         except OSError as exc:
             self._show_message(f"Failed to read {resolved}: {exc}", "error")
             return False
-        lines = raw_text.splitlines()
+        self._close_tail_handle()
         self._raw_lines.clear()
-        for line in lines[-self._config.max_buffer_lines :]:
-            self._raw_lines.append(line)
-        try:
-            self._tail_offset = resolved.stat().st_size
-        except OSError:
-            self._tail_offset = 0
-        self._tail_remainder = ""
+        self._parsed_lines.clear()
+        self._raw_lines.extend(lines)
+        self._tail_offset = end_offset
+        self._tail_remainder = b""
         self._update_state(selected_source=str(resolved))
         self._sync_regex_validation()
         self._render_log()
         self._restart_tail_timer()
         return True
 
-    def _sync_regex_validation(self) -> None:
-        sample = list(self._raw_lines)[-REGEX_SAMPLE_LIMIT:]
-        self.query_bar.validate_regex(sample)
+    def _sync_regex_validation(self, *, defer: bool = False) -> None:
+        # Walk back from the newest line so only the sample is touched, then restore
+        # chronological order.
+        sample = list(itertools.islice(reversed(self._raw_lines), REGEX_SAMPLE_LIMIT))
+        sample.reverse()
+        if defer:
+            self.query_bar.validate_regex_deferred(sample)
+        else:
+            self.query_bar.validate_regex(sample)
+
+    def _close_tail_handle(self) -> None:
+        if self._tail_handle is not None:
+            self._tail_handle.close()
+            self._tail_handle = None
+
+    def _base_tail_interval(self) -> float:
+        return max(0.25, 1 / max(self._config.refresh_hz, 1))
 
-    def _restart_tail_timer(self) -> None:
+    def _restart_tail_timer(self, interval: float | None = None) -> None:
         if self._tail_timer is not None:
             self._tail_timer.stop()
             self._tail_timer = None
+        self._tail_idle_polls = 0
         if not self._selected_source:
             return
-        interval = max(0.25, 1 / max(self._config.refresh_hz, 1))
-        self._tail_timer = self.set_interval(interval, self._poll_tail)
+        self._tail_interval = interval or self._base_tail_interval()
+        self._tail_timer = self.set_interval(self._tail_interval, self._poll_tail)
 
     def _poll_tail(self) -> None:
-        if not self._selected_source:
+        if self._read_tail():
+            if self._tail_interval > self._base_tail_interval():
+                self._restart_tail_timer()
+            else:
+                self._tail_idle_polls = 0
             return
+        # Back off while the file is quiet so an idle tail wakes up less often.
+        self._tail_idle_polls += 1
+        if self._tail_idle_polls >= TAIL_IDLE_POLLS and self._tail_interval < TAIL_MAX_INTERVAL:
+            self._restart_tail_timer(min(self._tail_interval * 2, TAIL_MAX_INTERVAL))
+
+    def _read_tail(self) -> bool:
+        """Append any bytes written since the last poll; return True if there were some."""
+
+        if not self._selected_source:
+            return False
         path = self._selected_source
         try:
-            size = path.stat().st_size
+            info = path.stat()
         except OSError:
-            return
-        if size < self._tail_offset:
+            return False
+        handle = self._tail_handle
+        if handle is None or info.st_ino != self._tail_inode:
+            # Keep one handle per tail session; reopen only when the path now
+            # names a different file (log rotation), reading that one from the start.
+            if handle is not None:
+                self._close_tail_handle()
+                self._tail_offset = 0
+                self._tail_remainder = b""
+            try:
+                handle = self._tail_handle = path.open("rb")
+            except OSError:
+                return False
+            self._tail_inode = info.st_ino
+        if info.st_size < self._tail_offset:
+            # Truncated in place; a partial line from before belongs to old content.
             self._tail_offset = 0
-        if size == self._tail_offset:
-            return
+            self._tail_remainder = b""
+        if info.st_size == self._tail_offset:
+            return False
+        # Read bytes so the offset stays a true byte position and a multi-byte
+        # character split across polls is decoded only once its line is complete.
         try:
-            with path.open("r", encoding="utf-8", errors="ignore") as handle:
-                handle.seek(self._tail_offset)
-                chunk = handle.read()
-                self._tail_offset = handle.tell()
+            handle.seek(self._tail_offset)
+            chunk = handle.read()
         except OSError:
-            return
+            return False
         if not chunk:
-            return
-        text = self._tail_remainder + chunk
-        lines = text.splitlines()
-        if text.endswith(("\n", "\r")):
-            remainder = ""
+            return False
+        self._tail_offset += len(chunk)
+        data = self._tail_remainder + chunk
+        lines = data.splitlines()
+        if data.endswith((b"\n", b"\r")):
+            remainder = b""
         else:
-            remainder = lines.pop() if lines else text
+            remainder = lines.pop() if lines else data
         self._tail_remainder = remainder
-        for line in lines:
-            self._raw_lines.append(line)
-        self._sync_regex_validation()
+        if not lines:
+            # Only a partial line arrived; nothing visible changed yet.
+            return True
+        # The deque's maxlen evicts the oldest lines as new ones arrive.
+        self._raw_lines.extend(line.decode("utf-8", errors="ignore") for line in lines)
+        self._sync_regex_validation(defer=True)
         self._render_log()
+        return True
+
+    def _schedule_render(self) -> None:
+        """Render once typing pauses instead of on every keystroke."""
+
+        if self._render_timer is not None:
+            self._render_timer.stop()
+        self._render_timer = self.set_timer(RENDER_DEBOUNCE, self._render_log)
 
     def _render_log(self) -> None:
-        self.log_panel.clear()
+        if self._render_timer is not None:
+            self._render_timer.stop()
+            self._render_timer = None
+        self._render_generation += 1
         if not self._selected_source:
+            self.log_panel.clear()
             if self._discovery_summary:
                 self._write_discovery_summary(self._discovery_summary)
             else:
                 self._write_log_line("Select a log from the tree to begin.")
             return
 
-        lines = list(self._raw_lines)
-        if not lines:
+        if not self._raw_lines:
+            self.log_panel.clear()
             self._write_log_line("No log entries found in the selected source.")
             return
 
-        filtered = self._apply_filters(lines)
-        if not filtered:
-            self._write_log_line("No log lines match the current filters.")
+        if len(self._parsed_lines) > 2 * self._config.max_buffer_lines:
+            # Lines evicted from the buffer while tailing are never looked up again.
+            self._parsed_lines.clear()
+        filters = self._filter_options()
+        if (
+            self.is_running
+            and len(self._raw_lines) >= FILTER_THREAD_MIN_LINES
+            and any(value is not None for value in filters.values())
+        ):
+            # Large filtered scans run off the event loop; the current output
+            # stays on screen until the result arrives.
+            self.run_worker(
+                partial(
+                    self._filter_in_thread,
+                    self._render_generation,
+                    list(self._raw_lines),
+                    filters,
+                    self._show_lines,
+                    self._parsed_lines,
+                ),
+                name="log-filter",
+                group="log-filter",
+                exclusive=True,
+                thread=True,
+                exit_on_error=False,
+            )
             return
 
-        visible = filtered[-self._show_lines :]
+        # Walk newest-first so filtering stops once the visible window is full.
+        newest_first = filter_log_lines(
+            reversed(self._raw_lines), **filters, limit=self._show_lines, memo=self._parsed_lines
+        )
+        self._show_filtered(newest_first)
+
+    def _filter_in_thread(
+        self,
+        generation: int,
+        lines: list[str],
+        filters: dict[str, object],
+        limit: int,
+        memo: dict[str, Optional[tuple[datetime, str, str]]],
+    ) -> None:
+        # Single dict gets/sets are atomic, so sharing the memo with the UI thread is safe.
+        newest_first = filter_log_lines(reversed(lines), **filters, limit=limit, memo=memo)
+        self.call_from_thread(self._apply_threaded_filter, generation, newest_first)
+
+    def _apply_threaded_filter(self, generation: int, newest_first: list[str]) -> None:
+        # Drop results for a render that has since been superseded.
+        if generation == self._render_generation:
+            self._show_filtered(newest_first)
 
-        for line in visible:
+    def _show_filtered(self, newest_first: list[str]) -> None:
+        self.log_panel.clear()
+        if not newest_first:
+            self._write_log_line("No log lines match the current filters.")
+            return
+
+        # Consecutive plain lines go out as one multi-line Text so RichLog does
+        # one write per run instead of one per line; structured panels flush it.
+        pending: list[Text] = []
+        for line in reversed(newest_first):
             renderable = self._renderable_for_line(line)
+            if isinstance(renderable, Text):
+                pending.append(renderable)
+                continue
+            if pending:
+                self._write_log_line(Text("\n").join(pending))
+                pending.clear()
             self._write_log_line(renderable)
+        if pending:
+            self._write_log_line(Text("\n").join(pending))
         if self.state.auto_scroll:
             self.log_panel.scroll_end(animate=False)
 
-    def _apply_filters(self, lines: list[str]) -> list[str]:
+    def _filter_options(self) -> dict[str, object]:
         level = None if self.state.severity == "all" else self.state.severity
         regex = self.state.query or None
         start: Optional[datetime] = None
@@ -1163,7 +1395,7 @@ class LogViewerApp(App[None]):
                 start, end = parse_timerange(self.state.time_window)
             except ValueError:
                 start = end = None
-        return filter_log_lines(lines, level=level, regex=regex, start=start, end=end)
+        return {"level": level, "regex": regex, "start": start, "end": end}
 
     def _renderable_for_line(self, line: str) -> RenderableType:
         if self.state.pretty_rendering:
@@ -1173,7 +1405,7 @@ class LogViewerApp(App[None]):
         return self._colorize_text(line)
 
     def _format_structured_line(self, line: str) -> RenderableType | None:
-        parsed = parse_log_line(line)
+        parsed = _parse_with_memo(line, self._parsed_lines)
         if not parsed:
             return None
         _, severity, message = parsed
@@ -1251,11 +1483,11 @@ class LogViewerApp(App[None]):
         return table, "CSV preview"
 
     def _colorize_text(self, line: str) -> Text:
-        parsed = parse_log_line(line)
         styled = Text(line)
-        if parsed:
-            _, severity, _ = parsed
-            color = SEVERITY_COLORS.get(severity)
+        # Only the level is needed here, so skip parse_log_line's timestamp parsing.
+        match = LOG_LINE_RE.match(line)
+        if match:
+            color = SEVERITY_COLORS.get(match.group("level").upper())
             if color:
                 styled.stylize(color)
         return styled
@@ -1393,7 +1625,7 @@ class LogViewerApp(App[None]):
     def action_toggle_copy_mode(self) -> None:
         self._copy_mode_active = not self._copy_mode_active
         self.set_class(self._copy_mode_active, "-copy-mode")
-        if self._copy_mode_active:
+        if self._copy_mode_active and self.focused is not self.log_panel:
             try:
                 self.set_focus(self.log_panel)
             except Exception:
@@ -1597,8 +1829,8 @@ class LogViewerApp(App[None]):
     async def on_input_changed(self, event: Input.Changed) -> None:  # type: ignore[override]
         if event.input.id == "query-input":
             self._update_state(query=event.value)
-            self._sync_regex_validation()
-            self._render_log()
+            self._sync_regex_validation(defer=True)
+            self._schedule_render()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:  # type: ignore[override]
         if event.button.id == "toggle-advanced":
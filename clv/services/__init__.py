@@ -1,9 +1,17 @@
-from .sources import ACCESS_HINT, SourceAddition, SourceManager, SourceMessage, persist_log_sources
+from .sources import (
+    ACCESS_HINT,
+    SourceAddition,
+    SourceManager,
+    SourceMessage,
+    path_sort_key,
+    persist_log_sources,
+)
 
 __all__ = [
     "ACCESS_HINT",
     "SourceAddition",
     "SourceManager",
     "SourceMessage",
+    "path_sort_key",
     "persist_log_sources",
 ]
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import os
+import stat
+from bisect import insort
 from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
 from typing import Iterable, Literal, Sequence
 
@@ -34,6 +37,12 @@ def _marker(path: Path) -> str:
         return str(path)
 
 
+def path_sort_key(path: str | Path) -> str:
+    """Case-insensitive ordering key shared by every source listing."""
+
+    return os.fspath(path).casefold()
+
+
 def normalize_path(raw: str | Path) -> Path:
     """Expand and absolutize a user supplied path without failing on missing targets."""
 
@@ -53,20 +62,20 @@ def normalize_path(raw: str | Path) -> Path:
 def check_access(path: Path) -> tuple[bool, str | None]:
     """Verify CLV can read from *path* before incorporating it."""
 
+    # One stat answers existence and type; os.access below still honours ACLs.
     try:
-        exists = path.exists()
+        mode = os.stat(path).st_mode
     except PermissionError:
         return False, f"Permission denied while checking '{path}'. {ACCESS_HINT}"
-
-    if not exists:
+    except (OSError, ValueError):
         return False, f"Path '{path}' does not exist."
 
-    if path.is_file():
+    if stat.S_ISREG(mode):
         if not os.access(path, os.R_OK):
             return False, f"Read access required for file '{path}'. {ACCESS_HINT}"
         return True, None
 
-    if path.is_dir():
+    if stat.S_ISDIR(mode):
         if not os.access(path, os.R_OK | os.X_OK):
             return False, f"List access required for directory '{path}'. {ACCESS_HINT}"
         try:
@@ -101,7 +110,7 @@ class SourceManager:
             marker = _marker(entry)
             if marker not in unique:
                 unique[marker] = entry
-        return sorted(unique.values(), key=lambda p: str(p).lower())
+        return sorted(unique.values(), key=path_sort_key)
 
     @property
     def directories(self) -> list[Path]:
@@ -113,7 +122,7 @@ class SourceManager:
 
     @property
     def added_paths(self) -> list[Path]:
-        return sorted(self._added, key=lambda p: str(p).lower())
+        return sorted(self._added, key=path_sort_key)
 
     def all_sources(self) -> list[Path]:
         return self.directories + self.files
@@ -153,12 +162,12 @@ class SourceManager:
         except OSError:
             resolved = path
 
+        is_file = False
         if resolved.is_dir():
-            self._directories.append(resolved)
-            self._directories.sort(key=lambda p: str(p).lower())
+            insort(self._directories, resolved, key=path_sort_key)
         elif resolved.is_file():
-            self._files.append(resolved)
-            self._files.sort(key=lambda p: str(p).lower())
+            insort(self._files, resolved, key=path_sort_key)
+            is_file = True
         else:
             return SourceAddition(
                 success=False,
@@ -170,7 +179,7 @@ class SourceManager:
         self._added.add(resolved)
 
         messages = [SourceMessage(f"Added {resolved} to the current session.", "info")]
-        if resolved.is_file() and resolved.suffix.lower() != ".log":
+        if is_file and resolved.suffix.lower() != ".log":
             messages.insert(
                 0,
                 SourceMessage(
@@ -193,12 +202,13 @@ def persist_log_sources(settings_path: Path, entries: Sequence[Path]) -> None:
 
     entry_strings = [
         str(path)
-        for path in sorted({ _marker(path): path for path in entries }.values(), key=lambda p: str(p).lower())
+        for path in sorted({_marker(path): path for path in entries}.values(), key=path_sort_key)
     ]
 
     def _merge_values(raw: str) -> str:
-        values = [piece.strip() for piece in raw.split(",") if piece.strip()]
-        merged = list(dict.fromkeys(values + entry_strings))
+        values = (piece.strip() for piece in raw.split(","))
+        # One pass over existing then new entries; dict keys keep first-seen order.
+        merged = dict.fromkeys(value for value in chain(values, entry_strings) if value)
         return ", ".join(merged)
 
     replaced = False
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Iterable
+from functools import lru_cache, partial
+from typing import Sequence
 from contextlib import contextmanager
 
 from textual import events
@@ -11,17 +12,98 @@ from textual.containers import Container
 from textual.css.query import NoMatches
 from textual.message import Message
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Button, Input, Label, RadioButton, RadioSet, Static, Switch
 
 from .segmented import SegmentedButtons
 
+# Bounds for the approximate hit counter shown in the query tooltip.
+REGEX_COUNT_MAX_LINES = 500
+REGEX_COUNT_MAX_HITS = 200
+# Quiet period before a deferred validation starts its background scan.
+REGEX_VALIDATE_DEBOUNCE = 0.15
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RegexStatus:
     valid: bool
     message: str
     matches: int | None = None
+    capped: bool = False
+
+
+@lru_cache(maxsize=64)
+def _compile_query(query: str) -> re.Pattern[str] | re.error:
+    """Compile *query* once per distinct string, caching failures as well."""
+    try:
+        return re.compile(query)
+    except re.error as exc:
+        return exc
+
+
+def _count_hits(compiled: re.Pattern[str], lines: Sequence[str]) -> tuple[int, bool]:
+    """Count lines matching *compiled*, stopping once REGEX_COUNT_MAX_HITS is reached."""
+    # Search line by line: on a joined sample, classes like \s or [^x], (?s). and
+    # lookarounds could match or peek across line boundaries.
+    search = compiled.search
+    hits = 0
+    for line in lines:
+        if search(line):
+            hits += 1
+            if hits >= REGEX_COUNT_MAX_HITS:
+                return hits, True
+    return hits, False
+
+
+_REGEX_META_RE = re.compile(r"[.^$*+?()\[\]{}\\]")
+
+
+@lru_cache(maxsize=64)
+def _literal_needles(query: str) -> tuple[str, ...] | None:
+    """Return the plain substrings behind a literal or ``a|b|c`` query, else None."""
+    if _REGEX_META_RE.search(query):
+        return None
+    return tuple(query.split("|"))
+
+
+def _count_literal_hits(needles: tuple[str, ...], lines: Sequence[str]) -> tuple[int, bool]:
+    """Substring counterpart of _count_hits for queries without regex syntax."""
+    hits = 0
+    if len(needles) == 1:
+        needle = needles[0]
+        for line in lines:
+            if needle in line:
+                hits += 1
+                if hits >= REGEX_COUNT_MAX_HITS:
+                    return hits, True
+        return hits, False
+    for line in lines:
+        if any(needle in line for needle in needles):
+            hits += 1
+            if hits >= REGEX_COUNT_MAX_HITS:
+                return hits, True
+    return hits, False
+
+
+def _evaluate_regex(query: str, sample: Sequence[str]) -> RegexStatus:
+    """Validate *query* and count approximate hits in *sample*."""
+    if not query:
+        return RegexStatus(True, "")
+    compiled = _compile_query(query)
+    if isinstance(compiled, re.error):
+        return RegexStatus(False, str(compiled))
+    if not sample:
+        return RegexStatus(True, "", matches=0)
+    # Callers pass lines oldest first; count the newest ones.
+    window = sample[-REGEX_COUNT_MAX_LINES:]
+    needles = _literal_needles(query)
+    if needles is not None:
+        hits, capped = _count_literal_hits(needles, window)
+    else:
+        hits, capped = _count_hits(compiled, window)
+    capped = capped or len(sample) > REGEX_COUNT_MAX_LINES
+    return RegexStatus(True, "", matches=hits, capped=capped)
 
 
 class LabeledField(Static):
@@ -48,8 +130,13 @@ class LabeledField(Static):
     def __init__(self, label: str, control: Widget, *, id: str | None = None) -> None:
         super().__init__(id=id)
         self._label = Label(label, classes="field-label")
-        # Wrap the control to match the CSS selector expectations
-        self._control_wrapper = Container(control, classes="field-control")
+        if isinstance(control, (Input, Switch)):
+            # Leaf inputs carry the class themselves; no extra DOM node needed.
+            control.add_class("field-control")
+            self._control_wrapper: Widget = control
+        else:
+            # Compound controls keep a wrapper so their own CSS stays untouched
+            self._control_wrapper = Container(control, classes="field-control")
 
     def compose(self) -> ComposeResult:
         yield self._label
@@ -59,6 +146,18 @@ class LabeledField(Static):
 class QueryBar(Container):
     """Top horizontal query band."""
 
+    ACTION_IDS: frozenset[str] = frozenset({"add-source", "run-query", "clear-query", "save-session"})
+    ACTION_NAV_ORDER: tuple[str, ...] = (
+        "toggle-advanced",
+        "add-source",
+        "run-query",
+        "clear-query",
+        "save-session",
+    )
+    ACTION_NAV_INDEX: dict[str, int] = {value: index for index, value in enumerate(ACTION_NAV_ORDER)}
+    ARROW_KEYS: frozenset[str] = frozenset({"left", "right"})
+    COMMIT_KEYS: frozenset[str] = frozenset({"enter", "space"})
+
     DEFAULT_CSS = """
     QueryBar {
         layout: vertical;
@@ -89,7 +188,7 @@ class QueryBar(Container):
     }
 
     #query-grid > .row > LabeledField:last-child { margin-right: 0; }
-    #time-row { align: left top; }
+    #query-grid > #time-row { align: left top; }
     #time-row > #time-controls {
         layout: horizontal;
         align: right top;
@@ -108,6 +207,7 @@ class QueryBar(Container):
     #actions-field {
         layout: horizontal;
         align: right top;
+        width: auto;
         height: auto;
         min-height: 3;
         padding: 1 0 0 0;
@@ -125,10 +225,11 @@ class QueryBar(Container):
     #advanced-button-field {
         layout: horizontal;
         align: right top;
+        width: auto;
         height: auto;
         min-height: 3;
-        padding: 0 0 0 0;
-        margin-right: 1;
+        padding: 1 0 0 0;
+        margin: 0;
     }
 
     #advanced-button-field Button {
@@ -203,15 +304,16 @@ class QueryBar(Container):
 
     QueryBar #actions-field { padding-top: 0; }
 
-    QueryBar #auto-scroll-field .field-control { width: auto; }
+    QueryBar #auto-scroll-field .field-control,
+    QueryBar #pretty-field .field-control { width: auto; }
 
     QueryBar Input.-regex-invalid {
         border: tall #f87171;
         background: $surface 14%;
     }
 
-    /* Time field: span available width, keep presets left-aligned */
-    QueryBar #time-field { width: auto; }
+    /* Time field: size to its presets, keep them left-aligned */
+    #query-grid > .row > #time-field { width: auto; }
     QueryBar #time-field .field-control {
         width: auto;
         layout: horizontal;
@@ -227,18 +329,28 @@ class QueryBar(Container):
         align: left middle;
     }
     QueryBar #time-field RadioButton {
+        width: auto;
+        min-width: 5;
         height: 3;
         align: center middle;
         margin-top: 0;
         margin-bottom: 0;
     }
     """
+    # RegexStatus compares by value, so re-assigning an identical status skips the watcher.
     regex_status = reactive(RegexStatus(True, ""))
 
     def __init__(self) -> None:
         super().__init__(id="query-bar")
         self._time_buttons: dict[str, RadioButton] = {}
         self._time_order: list[str] = []
+        self._time_nav_cache: list[str] = []
+        self._time_nav_index: dict[str, int] = {}
+        self._time_button_index: dict[RadioButton, int] = {}
+        self._time_button_values: dict[RadioButton, str] = {}
+        self._nav_buttons: dict[str, Button] = {}
+        self._last_regex_applied: tuple[bool, str | None] | None = None
+        self._validate_timer: Timer | None = None
         self._time_selection = "all"
         self._time_focus_value: str | None = "all"
 
@@ -249,6 +361,10 @@ class QueryBar(Container):
         self._ignore_next_radio_changed = 0
 
         self.time_set: RadioSet = self._build_time_controls()
+        # Controls touched on every keystroke are built here so handlers skip query_one.
+        self._query_input = Input(placeholder="ERROR|WARN", id="query-input")
+        self._auto_scroll_toggle = Switch(value=True, id="auto-scroll-toggle")
+        self._pretty_toggle = Switch(value=False, id="pretty-structured-toggle")
         self.severity_segmented = SegmentedButtons(
             [
                 ("all", "All"),
@@ -261,16 +377,11 @@ class QueryBar(Container):
         )
 
     def compose(self) -> ComposeResult:
-        query_input = Input(placeholder="ERROR|WARN", id="query-input")
-        query_field = LabeledField("Query", query_input, id="query-field")
+        query_field = LabeledField("Query", self._query_input, id="query-field")
         time_field = LabeledField("Time", self.time_set, id="time-field")
         severity_field = LabeledField("Severity", self.severity_segmented, id="severity-field")
-        auto_toggle = LabeledField("Auto-scroll", Switch(value=True, id="auto-scroll-toggle"), id="auto-scroll-field")
-        pretty_toggle = LabeledField(
-            "Structured output",
-            Switch(value=False, id="pretty-structured-toggle"),
-            id="pretty-field",
-        )
+        auto_toggle = LabeledField("Auto-scroll", self._auto_scroll_toggle, id="auto-scroll-field")
+        pretty_toggle = LabeledField("Structured output", self._pretty_toggle, id="pretty-field")
         advanced_toggle = Container(
             Button("Advanced Filters", id="toggle-advanced", variant="warning"),
             id="advanced-button-field",
@@ -314,201 +425,108 @@ class QueryBar(Container):
         range_button.value = self._time_selection == "range"
         self._time_buttons["range"] = range_button
         buttons.append(range_button)
+        self._time_nav_cache = [value for value in self._time_order if value in self._time_buttons]
+        self._time_nav_cache.append("range")
+        self._time_nav_index = {value: index for index, value in enumerate(self._time_nav_cache)}
+        self._time_button_values = {button: value for value, button in self._time_buttons.items()}
         return RadioSet(*buttons, id="time-presets")
 
     def on_mount(self) -> None:
-        self._apply_time_selection(self._time_selection, emit=False)
-
-        # ---- DEFENSIVE LAYOUT (works even if CSS isn't applied) ----
-        grid = self.query_one("#query-grid", Container)
-        grid.styles.layout = "vertical"
-        grid.styles.row_gap = 0
-        grid.styles.column_gap = 0
-
-        for row_id in ("query-row", "time-row"):
-            row = self.query_one(f"#{row_id}", Container)
-            row.styles.layout = "horizontal"
-            row.styles.align = ("left", "middle")
-            row.styles.margin = 0
-            row.styles.padding = 0
-            row.styles.width = "1fr"
-
-        row_time = self.query_one("#time-row", Container)
-        row_time.styles.align = ("left", "top")
-
-        for labeled_field in self.query("#query-grid LabeledField"):
-            labeled_field.styles.width = "1fr"
-            labeled_field.styles.height = "auto"
-            control_wrapper = labeled_field.query_one(".field-control", Container)
-            if labeled_field.id == "time-field":
-                labeled_field.styles.width = "auto"
-                control_wrapper.styles.width = "auto"
-                control_wrapper.styles.height = "auto"
-                control_wrapper.styles.min_height = 3
-                control_wrapper.styles.padding = (0, 1, 0, 1)
-                control_wrapper.styles.align = ("left", "middle")
-                control_wrapper.styles.content_align = ("left", "middle")
-                control_wrapper.styles.margin_left = 0
-                control_wrapper.styles.margin_right = 0
-            else:
-                control_wrapper.styles.height = 3
-                control_wrapper.styles.width = "1fr"
-
-        for field_id in ("auto-scroll-field", "pretty-field"):
-            self.query_one(f"#{field_id} .field-control", Container).styles.width = "auto"
-
-        self.query_one("#query-input", Input).styles.width = "1fr"
-        self.time_set.styles.width = "auto"
-        self.time_set.styles.layout = "horizontal"
-        self.time_set.styles.align = ("left", "middle")
-        self.time_set.styles.margin_left = 0
-        self.time_set.styles.margin_right = 0
-        self.query_one("#severity-field SegmentedButtons", SegmentedButtons).styles.width = "1fr"
-
-        actions = self.query_one("#actions-field", Container)
-        actions.styles.layout = "horizontal"
-        actions.styles.align = ("right", "top")
-        actions.styles.margin = 0
-        actions.styles.padding = (1, 0, 0, 0)
-        actions.styles.height = "auto"
-        actions.styles.min_height = 3
-        actions.styles.width = "auto"
-
-        advanced = self.query_one("#advanced-button-field", Container)
-        advanced.styles.layout = "horizontal"
-        advanced.styles.align = ("right", "top")
-        advanced.styles.margin = 0
-        advanced.styles.padding = (1, 0, 0, 0)
-        advanced.styles.height = "auto"
-        advanced.styles.min_height = 3
-        advanced.styles.width = "auto"
-        advanced.styles.margin_right = 1
-
-        auto_scroll_field = self.query_one("#auto-scroll-field", LabeledField)
-        auto_scroll_field.styles.width = "auto"
-        auto_scroll_field.styles.padding_top = 0
-        auto_scroll_field.styles.margin_right = 1
-
-        pretty_field = self.query_one("#pretty-field", LabeledField)
-        pretty_field.styles.width = "auto"
-        pretty_field.styles.padding_top = 0
-        pretty_field.styles.margin_right = 1
-
-        spacer = self.query_one("#time-spacer", Container)
-        spacer.styles.width = "1fr"
-        spacer.styles.min_width = 0
-
-        time_controls = self.query_one("#time-controls", Container)
-        time_controls.styles.layout = "horizontal"
-        time_controls.styles.align = ("right", "top")
-        time_controls.styles.width = "auto"
-        time_controls.styles.height = "auto"
-
-        for button in actions.query("Button"):
-            button.styles.height = 3
-            button.styles.min_height = 3
-            button.styles.margin_left = 1
-            button.styles.padding_left = 2
-            button.styles.padding_right = 2
-
-        first_button = actions.query_one("Button", expect_type=Button)
-        first_button.styles.margin_left = 0
-
-        advanced_button = advanced.query_one("Button", expect_type=Button)
-        advanced_button.styles.height = 3
-        advanced_button.styles.min_height = 3
-        advanced_button.styles.margin_left = 0
-        advanced_button.styles.margin_right = 0
-        advanced_button.styles.padding_left = 2
-        advanced_button.styles.padding_right = 2
-
-        for rb in self.time_set.query("RadioButton"):
-            rb.styles.width = "auto"
-            rb.styles.min_width = 5
-            rb.styles.height = 3
-
-        for btn in self.query_one("#severity-field").query("SegmentedButtons .segment"):
-            btn.styles.width = "auto"
-            btn.styles.min_width = 6
-            btn.styles.height = 3
-
-        self.styles.height = "auto"
-        self.styles.overflow_y = "hidden"
+        # RadioSet tracks its highlighted button by child index; resolve those once.
+        self._time_button_index = {
+            node: index
+            for index, node in enumerate(self.time_set._nodes)
+            if isinstance(node, RadioButton)
+        }
+        self._nav_buttons = {}
+        for button_id in self.ACTION_NAV_ORDER:
+            try:
+                self._nav_buttons[button_id] = self.query_one(f"#{button_id}", Button)
+            except NoMatches:
+                continue
+        # RadioSet announces its initially pressed button after mount; force the
+        # suppressed flip so that Changed is swallowed rather than re-emitted.
+        self._apply_time_selection(self._time_selection, emit=False, force=True)
 
     def watch_regex_status(self, status: RegexStatus) -> None:
-        query_input = self.query_one("#query-input", Input)
         if status.valid:
-            query_input.set_class(False, "-regex-invalid")
+            tooltip = None
             if status.matches is not None:
-                query_input.tooltip = f"≈ {status.matches} hits"
-            else:
-                query_input.tooltip = None
+                suffix = "+" if status.capped else ""
+                tooltip = f"≈ {status.matches}{suffix} hits"
         else:
-            query_input.set_class(True, "-regex-invalid")
-            query_input.tooltip = status.message or "Invalid regex"
+            tooltip = status.message or "Invalid regex"
+        applied = (not status.valid, tooltip)
+        if applied == self._last_regex_applied:
+            return
+        self._last_regex_applied = applied
+        self._query_input.set_class(not status.valid, "-regex-invalid")
+        self._query_input.tooltip = tooltip
 
     def get_query_value(self) -> str:
-        query_input = self.query_one("#query-input", Input)
-        return query_input.value
+        return self._query_input.value
 
     def set_query_value(self, value: str) -> None:
-        query_input = self.query_one("#query-input", Input)
-        query_input.value = value
+        self._query_input.value = value
+
+    def set_auto_scroll(self, value: bool) -> None:
+        self._auto_scroll_toggle.value = value
 
     def set_pretty_rendering(self, value: bool) -> None:
-        toggle = self.query_one("#pretty-structured-toggle", Switch)
-        toggle.value = value
+        self._pretty_toggle.value = value
 
     @contextmanager
-    def _suppress_time_events_ctx(self):
-        """Ignore RadioSet.Changed emitted by programmatic flips, released after a refresh."""
+    def _suppress_time_events_ctx(self, *, defer_release: bool = False):
+        """Ignore RadioSet.Changed emitted by programmatic flips.
+
+        ``prevent(RadioButton.Changed)`` only covers flips made inside the block; a
+        RadioSet.Changed already queued (such as the one RadioSet posts on mount) lands
+        later. Pass ``defer_release=True`` to keep the window open until after the next
+        refresh so those are swallowed too; otherwise it closes when the block exits.
+        """
         self._suppress_depth += 1
         self._suppress_time_event = True
         try:
             yield
         finally:
-            def _release_once():
-                self._suppress_depth = max(0, self._suppress_depth - 1)
-                if self._suppress_depth == 0:
-                    self._suppress_time_event = False
-            if self.app and self.app.is_running:
-                self.call_after_refresh(_release_once)
+            if defer_release and self.app and self.app.is_running:
+                self.call_after_refresh(self._release_time_event_suppression)
             else:
-                _release_once()
+                self._release_time_event_suppression()
     
-    def _set_time_radio_exclusive(self, target: str) -> None:
-        """Ensure exactly one time radio is checked."""
+    def _radios_match(self, target: str) -> bool:
+        """Return True when only the *target* time radio is checked."""
+        return all(button.value == (name == target) for name, button in self._time_buttons.items())
+
+    def _set_time_radio_exclusive(self, target: str, *, force: bool = False) -> bool:
+        """Ensure exactly one time radio is checked; return False when nothing changed.
+
+        ``force`` skips the no-op shortcut and holds suppression until after the next
+        refresh, for callers expecting a late RadioSet.Changed.
+        """
         button = self._time_buttons.get(target)
         if button is None:
             self._time_selection = target
-            return
-        with self._suppress_time_events_ctx():
+            return False
+        if (
+            not force
+            and self._time_selection == target
+            and self._time_focus_value == target
+            and self._radios_match(target)
+        ):
+            return False
+        with self._suppress_time_events_ctx(defer_release=force):
             with self.time_set.prevent(RadioButton.Changed):
                 for name, candidate in self._time_buttons.items():
-                    candidate.value = name == target
+                    wanted = name == target
+                    if candidate.value != wanted:
+                        candidate.value = wanted
                 # Keep RadioSet bookkeeping aligned with the manual flip
                 self.time_set._pressed_button = button
-                nodes = getattr(self.time_set, "_nodes", [])
-                try:
-                    index = nodes.index(button)
-                except ValueError:
-                    index = None
-                self.time_set._selected = index
+                self.time_set._selected = self._time_button_index.get(button)
                 self._time_focus_value = target
         self._time_selection = target
-    
-    def _reconcile_time_radios(self) -> None:
-        """Force radio visuals to match the canonical self._time_selection."""
-        target = self._time_selection
-        for name, button in self._time_buttons.items():
-            wanted = (name == target)
-            if button.value != wanted:
-                button.value = wanted
-
-    def _suppress_time_events(self) -> None:
-        # Prefer using the context manager. This is a safe, immediate suppress.
-        self._suppress_depth += 1
-        self._suppress_time_event = True
+        return True
 
     def _release_time_event_suppression(self) -> None:
         self._suppress_depth = max(0, self._suppress_depth - 1)
@@ -516,11 +534,8 @@ class QueryBar(Container):
             self._suppress_time_event = False
 
     def _time_nav_values(self) -> list[str]:
-        """Return ordered list of time button identifiers."""
-        values = [value for value in self._time_order if value in self._time_buttons]
-        if "range" in self._time_buttons:
-            values.append("range")
-        return values
+        """Return ordered list of time button identifiers (built with the radios)."""
+        return self._time_nav_cache
 
     def cycle_time_preset(self) -> str:
         if not self._time_order:
@@ -543,14 +558,12 @@ class QueryBar(Container):
     ) -> None:
         """Programmatically select a preset or 'range'."""
         if value in self._time_buttons:
-            self._set_time_radio_exclusive(value)
             self._apply_time_selection(value, start=start, end=end, emit=emit)
             return
         # Fallback to first preset if unknown
         if self._time_order:
             fallback = self._time_order[0]
             if fallback in self._time_buttons:
-                self._set_time_radio_exclusive(fallback)
                 self._apply_time_selection(fallback, emit=emit)
                 return
         self._apply_time_selection(value, start=start, end=end, emit=emit)
@@ -563,6 +576,7 @@ class QueryBar(Container):
         start: str | None = None,
         end: str | None = None,
         emit: bool = True,
+        force: bool = False,
     ) -> None:
         """Set canonical selection + tooltip; emit message if requested."""
         self._time_selection = value
@@ -572,9 +586,10 @@ class QueryBar(Container):
         if rb is not None and value == "range":
             rb.tooltip = f"{start} to {end}" if (start and end) else None
 
-        # Double-reconcile to be extra safe against any late synthetic events.
-        self._set_time_radio_exclusive(self._time_selection)
-        if self.app and self.app.is_running:
+        # Double-reconcile to be extra safe against any late synthetic events,
+        # but only when the synchronous pass actually flipped something.
+        changed = self._set_time_radio_exclusive(self._time_selection, force=force)
+        if changed and self.app and self.app.is_running:
             def _after():
                 self._set_time_radio_exclusive(self._time_selection)
             self.call_after_refresh(_after)
@@ -606,13 +621,11 @@ class QueryBar(Container):
             return
         if self._suppress_time_event:
             return
-        if getattr(self, "_ignore_next_radio_changed", 0) > 0:
+        if self._ignore_next_radio_changed > 0:
             self._ignore_next_radio_changed -= 1
             return
 
-        button_id = event.pressed.id or ""
-        value = button_id.removeprefix("time-") if button_id.startswith("time-") else self._time_selection
-
+        value = self._time_button_values.get(event.pressed, self._time_selection)
         self._handle_time_button_activation(value)
 
     def _handle_time_button_activation(self, value: str) -> None:
@@ -632,27 +645,59 @@ class QueryBar(Container):
             return
 
         # Normal preset: apply immediately
-        self._set_time_radio_exclusive(value)
         self._apply_time_selection(value, emit=True)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:  # type: ignore[override]
-        if event.button.id in {"add-source", "run-query", "clear-query", "save-session"}:
+        if event.button.id in self.ACTION_IDS:
             self.post_message(self.ActionTriggered(event.button.id))
 
-    def validate_regex(self, sample: Iterable[str]) -> None:
-        query = self.get_query_value()
-        if not query:
-            self.regex_status = RegexStatus(True, "")
-            return
-        try:
-            compiled = re.compile(query)
-        except re.error as exc:  # pragma: no cover - defensive
-            self.regex_status = RegexStatus(False, str(exc))
+    def validate_regex(self, sample: Sequence[str]) -> None:
+        self._cancel_deferred_validation()
+        self.regex_status = _evaluate_regex(self.get_query_value(), sample)
+
+    def validate_regex_deferred(self, sample: Sequence[str]) -> None:
+        """Debounce validation and run the scan in a thread worker.
+
+        *sample* must not be mutated afterwards; the worker reads it off the UI thread.
+        """
+        if not self.is_running:
+            self.validate_regex(sample)
             return
-        matches = sum(1 for line in sample if compiled.search(line))
-        self.regex_status = RegexStatus(True, "", matches=matches)
+        self._cancel_deferred_validation()
+        query = self.get_query_value()
+        self._validate_timer = self.set_timer(
+            REGEX_VALIDATE_DEBOUNCE,
+            partial(self._start_regex_worker, query, sample),
+        )
+
+    def _cancel_deferred_validation(self) -> None:
+        if self._validate_timer is not None:
+            self._validate_timer.stop()
+            self._validate_timer = None
+
+    def _start_regex_worker(self, query: str, sample: Sequence[str]) -> None:
+        self._validate_timer = None
+        self.run_worker(
+            partial(self._validate_in_thread, query, sample),
+            name="regex-validation",
+            group="regex-validation",
+            exclusive=True,
+            thread=True,
+            exit_on_error=False,
+        )
+
+    def _validate_in_thread(self, query: str, sample: Sequence[str]) -> None:
+        status = _evaluate_regex(query, sample)
+        self.app.call_from_thread(self._apply_deferred_status, query, status)
+
+    def _apply_deferred_status(self, query: str, status: RegexStatus) -> None:
+        # Drop results for a query the user has already edited away from.
+        if query == self.get_query_value():
+            self.regex_status = status
 
     class TimeWindowChanged(Message):
+        __slots__ = ("value", "start", "end")
+
         def __init__(self, value: str, *, start: str | None = None, end: str | None = None) -> None:
             super().__init__()
             self.value = value
@@ -660,21 +705,27 @@ class QueryBar(Container):
             self.end = end
 
     class SeverityChanged(Message):
+        __slots__ = ("value",)
+
         def __init__(self, value: str) -> None:
             super().__init__()
             self.value = value
 
     class ActionTriggered(Message):
+        __slots__ = ("action_id",)
+
         def __init__(self, action_id: str) -> None:
             super().__init__()
             self.action_id = action_id
 
     class CustomRangeRequested(Message):
+        __slots__ = ()
+
         def __init__(self) -> None:
             super().__init__()
 
     async def on_key(self, event: events.Key) -> None:
-        if event.key in {"left", "right"}:
+        if event.key in self.ARROW_KEYS:
             if (
                 self._navigate_time_buttons(event.key)
                 or self._navigate_severity_segments(event.key)
@@ -683,15 +734,14 @@ class QueryBar(Container):
                 event.stop()
                 return
 
-        if event.key in {"enter", "space"} and self._commit_time_focus():
+        if event.key in self.COMMIT_KEYS and self._commit_time_focus():
             event.stop()
             return
 
         if event.key == "enter":
             self.post_message(self.ActionTriggered("run-query"))
         elif event.key == "escape":
-            query = self.query_one("#query-input", Input)
-            query.value = ""
+            self._query_input.value = ""
             self.validate_regex([])
             self.post_message(self.ActionTriggered("clear-query"))
 
@@ -707,11 +757,8 @@ class QueryBar(Container):
             is_time_focus = True
             current_value = self._time_focus_value or self._time_selection
         elif isinstance(focused, RadioButton):
-            for value, button in self._time_buttons.items():
-                if button is focused:
-                    current_value = value
-                    is_time_focus = True
-                    break
+            current_value = self._time_button_values.get(focused)
+            is_time_focus = current_value is not None
 
         if not is_time_focus:
             return False
@@ -719,11 +766,9 @@ class QueryBar(Container):
         values = self._time_nav_values()
         if not values:
             return False
-        if current_value not in values:
-            current_value = values[0]
+        index = self._time_nav_index.get(current_value, 0)
 
         step = -1 if direction_key == "left" else 1
-        index = values.index(current_value)
         next_index = index + step
         if next_index < 0 or next_index >= len(values):
             return False
@@ -735,13 +780,8 @@ class QueryBar(Container):
 
     def _set_time_nav_focus(self, value: str | None) -> None:
         self._time_focus_value = value
-        nodes = getattr(self.time_set, "_nodes", [])
-        index = None
-        if value is not None:
-            button = self._time_buttons.get(value)
-            if button in nodes:
-                index = nodes.index(button)
-        self.time_set._selected = index
+        button = self._time_buttons.get(value) if value is not None else None
+        self.time_set._selected = self._time_button_index.get(button) if button is not None else None
 
     def _commit_time_focus(self) -> bool:
         if not self.screen:
@@ -779,18 +819,14 @@ class QueryBar(Container):
         button_id = focused.id
         if button_id is None:
             return False
-        nav_order = ["toggle-advanced", "add-source", "run-query", "clear-query", "save-session"]
-        if button_id not in nav_order:
+        index = self.ACTION_NAV_INDEX.get(button_id)
+        if index is None:
             return False
+        nav_order = self.ACTION_NAV_ORDER
         direction = -1 if direction_key == "left" else 1
-        index = nav_order.index(button_id)
         next_index = index + direction
         while 0 <= next_index < len(nav_order):
-            next_id = nav_order[next_index]
-            try:
-                target = self.query_one(f"#{next_id}", Button)
-            except NoMatches:
-                target = None
+            target = self._nav_buttons.get(nav_order[next_index])
             if target is not None:
                 target.focus()
                 return True
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import sys
+
 from rich.text import Text
 from textual import events
 from textual.app import ComposeResult
 from textual.message import Message
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Static
 
+HOVER_POST_DELAY = 0.02
+
 
 class SegmentedButtons(Static):
     """Simple segmented button group built from toggle buttons."""
@@ -85,10 +90,16 @@ class SegmentedButtons(Static):
 
     def __init__(self, options: list[tuple[str, str]], *, id: str | None = None) -> None:
         super().__init__(id=id)
-        self._options = options
-        self._current = options[0][0]
+        # Interned values let the key lookups and hover/active compares hit identity first.
+        self._options = [(sys.intern(value), label) for value, label in options]
+        self._keys: tuple[str, ...] = tuple(value for value, _ in self._options)
+        self._index_of: dict[str, int] = {value: index for index, value in enumerate(self._keys)}
+        self._current = self._keys[0]
         self._segments: dict[str, SegmentedButtons._Segment] = {}
+        self._segments_list: list[SegmentedButtons._Segment] = []
         self._hovered: str | None = None
+        self._posted_hover: str | None = None
+        self._hover_post_timer: Timer | None = None
         self._focused: str | None = None
 
     @property
@@ -106,43 +117,56 @@ class SegmentedButtons(Static):
         return self._focused
 
     def set_value(self, value: str) -> None:
+        value = sys.intern(value)
         if value == self._current:
             return
+        previous = self._current
         self._current = value
-        self._refresh_state()
+        self._swap_class(previous, value, "-active")
 
     def cycle(self) -> str:
-        keys = [opt for opt, _ in self._options]
-        index = keys.index(self._current)
+        keys = self._keys
+        index = self._index_of[self._current]
+        previous = self._current
         self._current = keys[(index + 1) % len(keys)]
-        self._refresh_state()
+        self._swap_class(previous, self._current, "-active")
         return self._current
 
     def compose(self) -> ComposeResult:
         self._segments.clear()
+        self._segments_list.clear()
         for value, label in self._options:
             segment = self._Segment(self, value, label)
             self._segments[value] = segment
+            self._segments_list.append(segment)
             yield segment
 
     def on_mount(self) -> None:
-        self._refresh_state()
-
-    def _refresh_state(self) -> None:
-        for value, segment in self._segments.items():
-            segment.set_class(value == self._current, "-active")
-            segment.set_class(self._hovered == value, "-hover")
+        # Freshly composed segments carry no state classes; only the active one needs one.
+        active = self._segments.get(self._current)
+        if active is not None:
+            active.add_class("-active")
+
+    def _swap_class(self, old: str | None, new: str | None, class_name: str) -> None:
+        """Move ``class_name`` from the ``old`` segment to the ``new`` one."""
+        if old is not None and (segment := self._segments.get(old)) is not None:
+            segment.remove_class(class_name)
+        if new is not None and (segment := self._segments.get(new)) is not None:
+            segment.add_class(class_name)
 
     def _activate(self, value: str) -> None:
         if value == self._current:
             return
+        previous = self._current
         self._current = value
-        self._refresh_state()
+        # Both class flips land in one repaint.
+        with self.app.batch_update():
+            self._swap_class(previous, value, "-active")
         self.post_message(self.ValueChanged(self, value))
 
     def owns_widget(self, widget: Widget) -> bool:
         """Return True if the widget is one of this group's segments."""
-        return any(segment is widget for segment in self._segments.values())
+        return isinstance(widget, SegmentedButtons._Segment) and widget._group is self
 
     def nudge(self, direction: int, *, anchor: str | None = None, commit: bool = False) -> bool:
         """Move focus left or right by one segment.
@@ -154,36 +178,41 @@ class SegmentedButtons(Static):
         """
         if direction == 0:
             return False
-        values = [opt for opt, _ in self._options]
-        if not values:
+        segments = self._segments_list
+        if not segments:
             return False
 
         current = anchor or self.focused_value or self._current
-        if current not in values:
-            current = values[0]
-
-        index = values.index(current)
+        index = self._index_of.get(current, 0)
         next_index = index + direction
-        if next_index < 0 or next_index >= len(values):
+        if next_index < 0 or next_index >= len(segments):
             return False
 
-        next_value = values[next_index]
-        segment = self._segments.get(next_value)
-        if segment is None:
-            return False
+        next_value = self._keys[next_index]
+        segment = segments[next_index]
+        # The segment's Focus handler records it as focused_value.
         segment.focus()
         if commit:
             self._activate(next_value)
-        else:
-            self._set_focused(next_value)
         return True
 
     def _set_hovered(self, value: str | None) -> None:
         if value == self._hovered:
             return
+        previous = self._hovered
         self._hovered = value
-        self._refresh_state()
-        self.post_message(self.HoverChanged(self, value))
+        self._swap_class(previous, value, "-hover")
+        # Classes update immediately; the message is coalesced so fast mouse
+        # travel across segments posts only the final hover target.
+        if self._hover_post_timer is None:
+            self._hover_post_timer = self.set_timer(HOVER_POST_DELAY, self._flush_hover_post)
+
+    def _flush_hover_post(self) -> None:
+        self._hover_post_timer = None
+        if self._hovered == self._posted_hover:
+            return
+        self._posted_hover = self._hovered
+        self.post_message(self.HoverChanged(self, self._hovered))
 
     def _set_focused(self, value: str | None) -> None:
         if value == self._focused:
@@ -191,39 +220,44 @@ class SegmentedButtons(Static):
         self._focused = value
 
     class _Segment(Static):
-        def __init__(self, parent: "SegmentedButtons", value: str, label: str) -> None:
+        # 0 activates the segment; -1/+1 move focus to a neighbour.
+        KEY_DIRECTIONS: dict[str, int] = {"enter": 0, "space": 0, "left": -1, "right": 1}
+
+        def __init__(self, group: "SegmentedButtons", value: str, label: str) -> None:
             super().__init__(label, classes="segment")
-            self._parent = parent
+            self._group = group
             self._value = value
             self._label = label
+            self._rendered = Text(label, justify="center")
             self.can_focus = True
 
         def render(self) -> Text:
-            return Text(self._label, justify="center")
+            return self._rendered
 
         def on_click(self, event: events.Click) -> None:
-            self._parent._activate(self._value)
+            self._group._activate(self._value)
 
         def on_key(self, event: events.Key) -> None:
-            if event.key in ("enter", "space"):
-                self._parent._activate(self._value)
+            direction = self.KEY_DIRECTIONS.get(event.key)
+            if direction is None:
+                return
+            if direction == 0:
+                self._group._activate(self._value)
+                event.stop()
+            elif self._group.nudge(direction, anchor=self._value, commit=False):
                 event.stop()
-            elif event.key in ("left", "right"):
-                direction = -1 if event.key == "left" else 1
-                if self._parent.nudge(direction, anchor=self._value, commit=False):
-                    event.stop()
 
-        def on_mouse_enter(self, event: events.MouseEnter) -> None:  # type: ignore[override]
-            self._parent._set_hovered(self._value)
+        def on_enter(self, event: events.Enter) -> None:
+            self._group._set_hovered(self._value)
 
-        def on_mouse_leave(self, event: events.MouseLeave) -> None:  # type: ignore[override]
-            self._parent._set_hovered(None)
+        def on_leave(self, event: events.Leave) -> None:
+            self._group._set_hovered(None)
 
         def on_focus(self, event: events.Focus) -> None:  # type: ignore[override]
-            self._parent._set_focused(self._value)
+            self._group._set_focused(self._value)
 
         def on_blur(self, event: events.Blur) -> None:  # type: ignore[override]
-            self._parent._set_focused(None)
+            self._group._set_focused(None)
 
     class ValueChanged(Message):
         def __init__(self, segmented: "SegmentedButtons", value: str) -> None:
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Iterator
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def runner() -> Iterator[asyncio.Runner]:
+    """One event loop for the whole run instead of a fresh one per asyncio.run()."""
+
+    with asyncio.Runner() as session_runner:
+        yield session_runner
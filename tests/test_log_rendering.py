@@ -1,8 +1,20 @@
+import asyncio
 from collections import deque
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, call
 
-from clv.app import DiscoverySummary, LogViewerApp
+from clv.app import (
+    REGEX_SAMPLE_LIMIT,
+    TAIL_IDLE_POLLS,
+    TAIL_MAX_INTERVAL,
+    DiscoverySummary,
+    LogViewerApp,
+    _compile_filter_regex,
+    filter_log_lines,
+    parse_log_line,
+    read_last_lines,
+)
 from clv.storage import SessionState
 from rich.console import Group
 from rich.text import Text
@@ -40,7 +52,8 @@ def test_render_log_writes_each_line_with_break() -> None:
 
     recorded = [entry.args[0] for entry in app.log_panel.write.call_args_list]
     assert all(isinstance(entry, Text) for entry in recorded)
-    assert [entry.plain for entry in recorded] == ["first entry", "second entry"]
+    # Plain lines may be batched into one write, but each keeps its own row.
+    assert "\n".join(entry.plain for entry in recorded).split("\n") == ["first entry", "second entry"]
 
 
 def test_render_log_shows_summary_without_selection() -> None:
@@ -129,3 +142,231 @@ def test_csv_formatter_respects_limits() -> None:
     assert label == "CSV preview"
     assert len(table.columns) == 2
     assert len(table.rows) == 2
+
+
+def test_render_log_ignores_invalid_regex() -> None:
+    app = _make_app()
+    app.log_panel.write = MagicMock()
+    app.log_panel.clear = MagicMock()
+    app.state = SessionState(auto_scroll=False, query="(unclosed")
+    app._selected_source = Path("/tmp/example.log")
+    app._raw_lines = deque(["2024-01-01 12:00:00 - INFO - still shown"])
+
+    app._render_log()
+
+    recorded = [entry.args[0] for entry in app.log_panel.write.call_args_list]
+    assert [entry.plain for entry in recorded] == ["2024-01-01 12:00:00 - INFO - still shown"]
+
+
+def test_poll_tail_backs_off_while_idle_and_resets_on_data(tmp_path: Path) -> None:
+    log_file = tmp_path / "app.log"
+    log_file.write_text("first\n", encoding="utf-8")
+    app = _make_app()
+    app.state = SessionState(auto_scroll=False)
+    app._selected_source = log_file
+    app._tail_offset = log_file.stat().st_size
+    app._sync_regex_validation = MagicMock()
+    base = app._base_tail_interval()
+    app._tail_interval = base
+    restarts: list[float | None] = []
+
+    def _restart(interval: float | None = None) -> None:
+        restarts.append(interval)
+        app._tail_interval = interval or base
+        app._tail_idle_polls = 0
+
+    app._restart_tail_timer = _restart
+
+    for _ in range(TAIL_IDLE_POLLS):
+        app._poll_tail()
+    assert restarts == [min(base * 2, TAIL_MAX_INTERVAL)]
+
+    with log_file.open("a", encoding="utf-8") as handle:
+        handle.write("second\n")
+    app._poll_tail()
+
+    assert restarts[-1] is None
+    assert list(app._raw_lines) == ["second"]
+    app._close_tail_handle()
+
+
+def test_render_log_keeps_newest_matches_within_window() -> None:
+    app = _make_app()
+    app.log_panel.write = MagicMock()
+    app.log_panel.clear = MagicMock()
+    app.state = SessionState(auto_scroll=False, severity="error")
+    app._selected_source = Path("/tmp/example.log")
+    app._show_lines = 2
+    app._raw_lines = deque(
+        [
+            "2024-01-01 12:00:00 - ERROR - one",
+            "2024-01-01 12:00:01 - INFO - skip",
+            "2024-01-01 12:00:02 - ERROR - two",
+            "2024-01-01 12:00:03 - ERROR - three",
+        ]
+    )
+
+    app._render_log()
+
+    recorded = "\n".join(entry.args[0].plain for entry in app.log_panel.write.call_args_list)
+    assert recorded.split("\n") == [
+        "2024-01-01 12:00:02 - ERROR - two",
+        "2024-01-01 12:00:03 - ERROR - three",
+    ]
+
+
+def test_read_last_lines_reads_only_the_tail(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("clv.app.TAIL_READ_BLOCK", 16)
+    log_file = tmp_path / "big.log"
+    log_file.write_text("".join(f"entry {index}\n" for index in range(200)), encoding="utf-8")
+
+    lines, end = read_last_lines(log_file, 3)
+
+    assert lines == ["entry 197", "entry 198", "entry 199"]
+    assert end == log_file.stat().st_size
+
+
+def test_large_filtered_render_runs_in_worker(monkeypatch, runner: asyncio.Runner) -> None:
+    monkeypatch.setattr("clv.app.FILTER_THREAD_MIN_LINES", 10)
+
+    async def scenario() -> None:
+        app = LogViewerApp()
+        async with app.run_test() as pilot:
+            app.state = SessionState(auto_scroll=False, severity="error")
+            app._selected_source = Path("/tmp/example.log")
+            app._raw_lines = deque(
+                f"2024-01-01 12:00:{index:02d} - {'ERROR' if index % 2 else 'INFO'} - entry {index}"
+                for index in range(20)
+            )
+            app.log_panel.write = MagicMock()
+
+            app._render_log()
+            app.log_panel.write.assert_not_called()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            written = "\n".join(entry.args[0].plain for entry in app.log_panel.write.call_args_list)
+            assert written.split("\n")[-1] == "2024-01-01 12:00:19 - ERROR - entry 19"
+            assert "INFO" not in written
+
+    runner.run(scenario())
+
+
+def test_read_tail_joins_multibyte_characters_split_across_polls(tmp_path: Path) -> None:
+    log_file = tmp_path / "app.log"
+    log_file.write_bytes(b"")
+    app = _make_app()
+    app.state = SessionState(auto_scroll=False)
+    app._selected_source = log_file
+    app._sync_regex_validation = MagicMock()
+    encoded = "café ready\n".encode("utf-8")
+    split = encoded.index(b"\xa9")
+
+    log_file.write_bytes(encoded[:split])
+    app._read_tail()
+    with log_file.open("ab") as handle:
+        handle.write(encoded[split:])
+    app._read_tail()
+
+    assert list(app._raw_lines) == ["café ready"]
+    assert app._tail_offset == len(encoded)
+    app._close_tail_handle()
+
+
+def test_read_tail_follows_rotated_file(tmp_path: Path) -> None:
+    log_file = tmp_path / "app.log"
+    log_file.write_text("old entry\n", encoding="utf-8")
+    app = _make_app()
+    app.state = SessionState(auto_scroll=False)
+    app._selected_source = log_file
+    app._tail_offset = log_file.stat().st_size
+    app._sync_regex_validation = MagicMock()
+    app._read_tail()
+
+    log_file.rename(tmp_path / "app.log.1")
+    log_file.write_text("fresh entry\n", encoding="utf-8")
+    app._read_tail()
+
+    assert list(app._raw_lines) == ["fresh entry"]
+    app._close_tail_handle()
+
+
+def test_read_tail_drops_partial_line_on_rotation(tmp_path: Path) -> None:
+    log_file = tmp_path / "app.log"
+    log_file.write_text("old entry\n", encoding="utf-8")
+    app = _make_app()
+    app.state = SessionState(auto_scroll=False)
+    app._selected_source = log_file
+    app._tail_offset = log_file.stat().st_size
+    app._sync_regex_validation = MagicMock()
+    app._read_tail()
+
+    with log_file.open("a", encoding="utf-8") as handle:
+        handle.write("PARTIAL-no-newline")
+    app._read_tail()
+    log_file.rename(tmp_path / "app.log.1")
+    log_file.write_text("2024-01-01 14:00:00 - ERROR - rotated\n", encoding="utf-8")
+    app._read_tail()
+
+    assert list(app._raw_lines) == ["2024-01-01 14:00:00 - ERROR - rotated"]
+    app._close_tail_handle()
+
+
+def test_filter_log_lines_reuses_compiled_regex() -> None:
+    _compile_filter_regex.cache_clear()
+    lines = ["2024-01-01 12:00:00 - INFO - disk ok", "2024-01-01 12:00:01 - INFO - net down"]
+
+    assert filter_log_lines(lines, regex="disk") == lines[:1]
+    assert filter_log_lines(lines, regex="disk") == lines[:1]
+
+    info = _compile_filter_regex.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
+def test_parse_log_line_matches_strptime_timestamps() -> None:
+    for stamp, fmt in [
+        ("2024-03-05 07:08:09", "%Y-%m-%d %H:%M:%S"),
+        ("2024-03-05 07:08:09,123", "%Y-%m-%d %H:%M:%S,%f"),
+        ("2024-03-05 07:08:09.5", "%Y-%m-%d %H:%M:%S.%f"),
+    ]:
+        parsed = parse_log_line(f"{stamp} - warn - message")
+        assert parsed == (datetime.strptime(stamp, fmt), "WARN", "message")
+
+    assert parse_log_line("2024-02-30 07:08:09 - INFO - bad date") is None
+    assert parse_log_line("2024-03-05 07:08:09.1234567 - INFO - too precise") is None
+
+
+def test_sync_regex_validation_sends_only_the_newest_sample() -> None:
+    app = _make_app()
+    app.query_bar = MagicMock()
+    app._raw_lines = deque(f"line {index}" for index in range(REGEX_SAMPLE_LIMIT + 50))
+
+    app._sync_regex_validation()
+
+    sample = app.query_bar.validate_regex.call_args.args[0]
+    assert len(sample) == REGEX_SAMPLE_LIMIT
+    assert sample[0] == "line 50"
+    assert sample[-1] == f"line {REGEX_SAMPLE_LIMIT + 49}"
+
+
+def test_parse_memo_follows_the_selected_buffer() -> None:
+    app = _make_app()
+    app.log_panel.write = MagicMock()
+    app.log_panel.clear = MagicMock()
+    app.state = SessionState(auto_scroll=False, severity="error")
+    app._selected_source = Path("/tmp/example.log")
+    app._raw_lines = deque(
+        ["2024-01-01 12:00:00 - ERROR - one", "2024-01-01 12:00:01 - INFO - two"]
+    )
+
+    app._render_log()
+    assert set(app._parsed_lines) == set(app._raw_lines)
+
+    # Stale entries beyond twice the buffer size are dropped before the next scan.
+    evicted = 2 * app._config.max_buffer_lines
+    app._parsed_lines.update({f"gone {index}": None for index in range(evicted)})
+    app._render_log()
+    assert set(app._parsed_lines) == set(app._raw_lines)
+
+    app._clear_selected_source_state()
+    assert app._parsed_lines == {}
@@ -7,7 +7,13 @@ from textual.widgets import Button
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from clv.widgets.query_bar import QueryBar
+from clv.widgets.query_bar import (
+    REGEX_COUNT_MAX_HITS,
+    REGEX_COUNT_MAX_LINES,
+    REGEX_VALIDATE_DEBOUNCE,
+    QueryBar,
+)
+from clv.widgets.segmented import HOVER_POST_DELAY, SegmentedButtons
 
 
 class _QueryBarHarness(App[None]):
@@ -16,6 +22,7 @@ class _QueryBarHarness(App[None]):
     def __init__(self) -> None:
         super().__init__()
         self.custom_requests = 0
+        self.time_windows: list[str] = []
 
     def compose(self) -> ComposeResult:
         self.query_bar = QueryBar()
@@ -24,8 +31,11 @@ class _QueryBarHarness(App[None]):
     def on_query_bar_custom_range_requested(self, message: QueryBar.CustomRangeRequested) -> None:
         self.custom_requests += 1
 
+    def on_query_bar_time_window_changed(self, message: QueryBar.TimeWindowChanged) -> None:
+        self.time_windows.append(message.value)
 
-def test_custom_range_selection_deactivates_other_presets() -> None:
+
+def test_custom_range_selection_deactivates_other_presets(runner: asyncio.Runner) -> None:
     """Applying a custom range should only leave the Custom indicator lit."""
 
     async def _exercise() -> None:
@@ -53,10 +63,10 @@ def test_custom_range_selection_deactivates_other_presets() -> None:
                 not active for name, active in states_after_reclick.items() if name != "range"
             )
 
-    asyncio.run(_exercise())
+    runner.run(_exercise())
 
 
-def test_severity_segments_arrow_navigation() -> None:
+def test_severity_segments_arrow_navigation(runner: asyncio.Runner) -> None:
     async def _exercise() -> None:
         app = _QueryBarHarness()
         async with app.run_test() as pilot:
@@ -70,11 +80,14 @@ def test_severity_segments_arrow_navigation() -> None:
             await pilot.pause()
             assert qb.severity_segmented.value == "all"
             assert qb.screen.focused is qb.severity_segmented._segments["info"]
+            assert qb.severity_segmented.focused_value == "info"
 
             # Selection should update only when Enter/Space is pressed.
             await pilot.press("enter")
             await pilot.pause()
             assert qb.severity_segmented.value == "info"
+            active = [v for v, seg in qb.severity_segmented._segments.items() if seg.has_class("-active")]
+            assert active == ["info"]
 
             await pilot.press("left")
             await pilot.pause()
@@ -85,10 +98,30 @@ def test_severity_segments_arrow_navigation() -> None:
             await pilot.pause()
             assert qb.severity_segmented.value == "all"
 
-    asyncio.run(_exercise())
+    runner.run(_exercise())
+
+
+def test_programmatic_time_selection_does_not_emit(runner: asyncio.Runner) -> None:
+    """Neither mounting nor select_time(..., emit=False) may report a time change."""
+
+    async def _exercise() -> None:
+        app = _QueryBarHarness()
+        async with app.run_test() as pilot:
+            qb = app.query_bar
+            await pilot.pause()
+            await pilot.pause()
+            assert app.time_windows == []
+
+            qb.select_time("1h", emit=False)
+            await pilot.pause()
+            await pilot.pause()
+            assert app.time_windows == []
+            assert qb._time_selection == "1h"
+
+    runner.run(_exercise())
 
 
-def test_time_presets_require_confirmation() -> None:
+def test_time_presets_require_confirmation(runner: asyncio.Runner) -> None:
     async def _exercise() -> None:
         app = _QueryBarHarness()
         async with app.run_test() as pilot:
@@ -115,10 +148,10 @@ def test_time_presets_require_confirmation() -> None:
             await pilot.pause()
             assert qb._time_selection == "all"
 
-    asyncio.run(_exercise())
+    runner.run(_exercise())
 
 
-def test_action_buttons_arrow_navigation() -> None:
+def test_action_buttons_arrow_navigation(runner: asyncio.Runner) -> None:
     async def _exercise() -> None:
         app = _QueryBarHarness()
         async with app.run_test() as pilot:
@@ -142,4 +175,100 @@ def test_action_buttons_arrow_navigation() -> None:
                 assert qb.screen.focused is not None
                 assert qb.screen.focused.id == expected_id
 
-    asyncio.run(_exercise())
+    runner.run(_exercise())
+
+
+def test_validate_regex_reports_status(runner: asyncio.Runner) -> None:
+    async def _exercise() -> None:
+        app = _QueryBarHarness()
+        async with app.run_test() as pilot:
+            qb = app.query_bar
+            await pilot.pause()
+
+            qb.set_query_value("ERROR")
+            qb.validate_regex(["ERROR one", "INFO two", "ERROR three"])
+            assert qb.regex_status.valid is True
+            assert qb.regex_status.matches == 2
+            assert qb.regex_status.capped is False
+
+            qb.set_query_value("^INFO")
+            qb.validate_regex(["ERROR INFO", "INFO two", "INFO three"])
+            assert qb.regex_status.matches == 2
+
+            qb.set_query_value("ERROR")
+            qb.validate_regex(["ERROR"] * (REGEX_COUNT_MAX_HITS + 50))
+            assert qb.regex_status.matches == REGEX_COUNT_MAX_HITS
+            assert qb.regex_status.capped is True
+
+            # Samples arrive oldest first; the newest lines are the ones counted.
+            qb.validate_regex(["INFO old"] * REGEX_COUNT_MAX_LINES + ["ERROR new"] * 10)
+            assert qb.regex_status.matches == 10
+            assert qb.regex_status.capped is True
+
+            qb.set_query_value("(unclosed")
+            qb.validate_regex(["ERROR one"])
+            assert qb.regex_status.valid is False
+            assert qb.regex_status.message
+
+            # The cached failure must still report the same error on repeat validation.
+            qb.validate_regex(["ERROR one"])
+            assert qb.regex_status.valid is False
+
+            # Hits are counted per line; nothing may match across a line break.
+            for query in (r"a\sb", r"a\Wb", r"(?s)a.b", r"\D{3}full"):
+                qb.set_query_value(query)
+                qb.validate_regex(["disk a", "b full", "ok"])
+                assert qb.regex_status.matches == 0, query
+            qb.set_query_value(r"(?<!\n)full")
+            qb.validate_regex(["disk a", "b full", "ok"])
+            assert qb.regex_status.matches == 1
+
+    runner.run(_exercise())
+
+
+def test_deferred_regex_validation_applies_latest_query(runner: asyncio.Runner) -> None:
+    async def _exercise() -> None:
+        app = _QueryBarHarness()
+        async with app.run_test() as pilot:
+            qb = app.query_bar
+            await pilot.pause()
+
+            qb.set_query_value("WARN")
+            qb.validate_regex_deferred(["WARN a", "INFO b"])
+            qb.set_query_value("INFO")
+            qb.validate_regex_deferred(["WARN a", "INFO b", "INFO c"])
+            await pilot.pause(REGEX_VALIDATE_DEBOUNCE * 2)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert qb.regex_status.valid is True
+            assert qb.regex_status.matches == 2
+
+    runner.run(_exercise())
+
+
+def test_severity_hover_messages_are_coalesced(runner: asyncio.Runner) -> None:
+    """Rapid hover changes toggle classes at once but post a single HoverChanged."""
+
+    async def _exercise() -> None:
+        app = _QueryBarHarness()
+        posted: list[str | None] = []
+        async with app.run_test() as pilot:
+            segmented = app.query_bar.severity_segmented
+            await pilot.pause()
+            post_message = segmented.post_message
+
+            def _record(message):
+                if isinstance(message, SegmentedButtons.HoverChanged):
+                    posted.append(message.value)
+                return post_message(message)
+
+            segmented.post_message = _record
+            for value in ("all", "info", "warn"):
+                segmented._set_hovered(value)
+            assert segmented._segments["warn"].has_class("-hover")
+            assert not segmented._segments["info"].has_class("-hover")
+            await pilot.pause(HOVER_POST_DELAY * 5)
+            assert posted == ["warn"]
+
+    runner.run(_exercise())
@@ -3,29 +3,65 @@ from __future__ import annotations
 from pathlib import Path
 
 import asyncio
+import re
+from typing import Callable, Coroutine, Iterator
 from unittest.mock import AsyncMock, MagicMock
 
+import pytest
+from textual.pilot import Pilot
+
 from clv.app import LogTree, LogViewerApp
 from clv.services import SourceAddition, SourceManager, persist_log_sources
 
+RunScenario = Callable[[Coroutine[object, object, None]], None]
+
+
+@pytest.fixture(scope="module")
+def shared_app(runner: asyncio.Runner) -> Iterator[tuple[Pilot, RunScenario]]:
+    """Boot one LogViewerApp for the module; the session runner keeps its loop alive between tests."""
+
+    harness = LogViewerApp().run_test()
+    pilot = runner.run(harness.__aenter__())
+    try:
+        yield pilot, runner.run
+    finally:
+        runner.run(harness.__aexit__(None, None, None))
+
+
+@pytest.fixture
+def log_sandbox(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """An empty ``logs`` directory carved out of the session's shared temp root."""
+
+    sandbox = tmp_path_factory.mktemp("clv", numbered=True) / "logs"
+    sandbox.mkdir()
+    return sandbox
+
+
+@pytest.fixture
+def viewer(shared_app: tuple[Pilot, RunScenario]) -> tuple[Pilot, RunScenario]:
+    """Hand each test the shared app with a fresh source manager and an empty log panel."""
+
+    pilot, run = shared_app
+    pilot.app._source_manager = SourceManager([], [])
+    pilot.app.log_panel.clear()
+    return pilot, run
 
-def test_source_manager_adds_directory(tmp_path: Path) -> None:
-    sample_dir = tmp_path / "logs"
-    sample_dir.mkdir()
+
+def test_source_manager_adds_directory(log_sandbox: Path) -> None:
+    sample_dir = log_sandbox
 
     manager = SourceManager([], [])
     result = manager.add(str(sample_dir))
 
     assert result.success is True
-    assert sample_dir.resolve() in manager.directories
-    assert sample_dir.resolve() in manager.added_paths
-    severities = [message.severity for message in result.messages]
-    assert "info" in severities
+    assert result.path == sample_dir.resolve()
+    assert result.path in manager.directories
+    assert result.path in manager.added_paths
+    assert any(message.severity == "info" for message in result.messages)
 
 
-def test_source_manager_rejects_duplicates(tmp_path: Path) -> None:
-    sample_dir = tmp_path / "logs"
-    sample_dir.mkdir()
+def test_source_manager_rejects_duplicates(log_sandbox: Path) -> None:
+    sample_dir = log_sandbox
 
     manager = SourceManager([sample_dir], [])
     duplicate = manager.add(str(sample_dir))
@@ -35,9 +71,8 @@ def test_source_manager_rejects_duplicates(tmp_path: Path) -> None:
     assert duplicate.messages[0].severity == "warning"
 
 
-def test_source_manager_warns_for_non_log_file(tmp_path: Path) -> None:
-    sample_dir = tmp_path / "logs"
-    sample_dir.mkdir()
+def test_source_manager_warns_for_non_log_file(log_sandbox: Path) -> None:
+    sample_dir = log_sandbox
     sample_file = sample_dir / "output.txt"
     sample_file.write_text("test", encoding="utf-8")
 
@@ -45,10 +80,9 @@ def test_source_manager_warns_for_non_log_file(tmp_path: Path) -> None:
     result = manager.add(str(sample_file))
 
     assert result.success is True
-    severities = [message.severity for message in result.messages]
-    assert "warning" in severities
-    assert "info" in severities
-    assert sample_file.resolve() in manager.files
+    assert any(message.severity == "warning" for message in result.messages)
+    assert any(message.severity == "info" for message in result.messages)
+    assert result.path in manager.files
 
 
 def test_persist_log_sources_creates_file(tmp_path: Path) -> None:
@@ -57,12 +91,12 @@ def test_persist_log_sources_creates_file(tmp_path: Path) -> None:
 
     persist_log_sources(config_path, entries)
 
-    data = config_path.read_text(encoding="utf-8").splitlines()
-    assert "[log_viewer]" in data
-    assert any(line.startswith("log_dirs = ") for line in data)
-    log_line = next(line for line in data if line.startswith("log_dirs = "))
-    assert "/var/log/app.log" in log_line
-    assert "/var/log/custom" in log_line
+    contents = config_path.read_text(encoding="utf-8")
+    assert re.search(r"(?m)^\[log_viewer\]$", contents)
+    log_dirs = re.search(r"(?m)^log_dirs = (.*)$", contents)
+    assert log_dirs is not None
+    assert "/var/log/app.log" in log_dirs.group(1)
+    assert "/var/log/custom" in log_dirs.group(1)
 
 
 def test_persist_log_sources_merges_existing_values(tmp_path: Path) -> None:
@@ -78,120 +112,110 @@ def test_persist_log_sources_merges_existing_values(tmp_path: Path) -> None:
     assert "log_dirs = /var/log, /opt/service.log" in contents
 
 
-def test_added_source_appears_in_tree(tmp_path: Path) -> None:
-    sample_dir = tmp_path / "logs"
-    sample_dir.mkdir()
+def test_added_source_appears_in_tree(log_sandbox: Path, viewer) -> None:
+    pilot, run = viewer
+    app = pilot.app
+    sample_dir = log_sandbox
     (sample_dir / "service.log").write_text("line", encoding="utf-8")
 
     async def scenario() -> None:
-        app = LogViewerApp()
-        async with app.run_test() as pilot:  # noqa: F841 - pilot kept for context management
-            app._source_manager = SourceManager([], [])
-            await app._populate_tree()
+        await app._populate_tree()
 
-            addition = app._source_manager.add(str(sample_dir))
-            assert addition.success is True
+        addition = app._source_manager.add(str(sample_dir))
+        assert addition.success is True
 
-            await app._populate_tree()
-            app._highlight_source(sample_dir)
+        await app._populate_tree()
+        app._highlight_source(sample_dir)
 
-            tree_panel = app.query_one("#tree-panel")
-            directory_tree = tree_panel.query_one(LogTree)
-            assert directory_tree.root.data == sample_dir.resolve()
-            focused = directory_tree.cursor_node
-            assert focused is not None
-            assert isinstance(focused.data, Path)
-            assert focused.data.resolve() == sample_dir.resolve()
+        tree_panel = app.query_one("#tree-panel")
+        directory_tree = tree_panel.query_one(LogTree)
+        assert directory_tree.root.data == sample_dir.resolve()
+        focused = directory_tree.cursor_node
+        assert focused is not None
+        assert isinstance(focused.data, Path)
+        assert focused.data.resolve() == sample_dir.resolve()
 
-    asyncio.run(scenario())
+    run(scenario())
 
 
-def test_show_message_uses_colored_toasts() -> None:
+def test_show_message_uses_colored_toasts(viewer, monkeypatch) -> None:
+    pilot, run = viewer
+    app = pilot.app
+    mock_notify = MagicMock()
+    monkeypatch.setattr(app, "notify", mock_notify)
 
-    async def scenario() -> None:
-        app = LogViewerApp()
-        async with app.run_test() as pilot:  # noqa: F841 - pilot kept for context management
-            mock_notify = MagicMock()
-            app.notify = mock_notify
-
-            def panel_contains(substring: str) -> bool:
-                for strip in app.log_panel.lines:
-                    plain = getattr(strip, "plain", None)
-                    if plain is None:
-                        plain = str(strip)
-                    if substring in plain:
-                        return True
-                return False
-
-            app.log_panel.clear()
-            app._show_message("All good", "info")
-            await pilot.pause()
-            info_kwargs = mock_notify.call_args_list[-1].kwargs
-            assert info_kwargs["severity"] == "information"
-            assert info_kwargs["title"] == ""
-            assert info_kwargs["markup"] is False
-            assert panel_contains("SUCCESS: All good")
-
-            app.log_panel.clear()
-            app._show_message("Heads up", "warning")
-            await pilot.pause()
-            warning_kwargs = mock_notify.call_args_list[-1].kwargs
-            assert warning_kwargs["severity"] == "warning"
-            assert panel_contains("WARNING: Heads up")
-
-    asyncio.run(scenario())
-
-
-def test_prompt_add_source_cancel_shows_notification(monkeypatch) -> None:
+    def last_line_plain() -> str:
+        # The panel is cleared before each message, so only the newest strip matters.
+        strip = app.log_panel.lines[-1]
+        plain = getattr(strip, "plain", None)
+        return plain if plain is not None else str(strip)
 
     async def scenario() -> None:
-        app = LogViewerApp()
-        async with app.run_test() as pilot:  # noqa: F841 - pilot kept for context management
-            app._source_manager = SourceManager([], [])
-            monkeypatch.setattr(app, "push_screen", AsyncMock(return_value=None))
+        app.log_panel.clear()
+        app._show_message("All good", "info")
+        await pilot.pause()
+        info_kwargs = mock_notify.call_args_list[-1].kwargs
+        assert info_kwargs["severity"] == "information"
+        assert info_kwargs["title"] == ""
+        assert info_kwargs["markup"] is False
+        assert "SUCCESS: All good" in last_line_plain()
 
-            notifications: list[tuple[str, str]] = []
+        app.log_panel.clear()
+        app._show_message("Heads up", "warning")
+        await pilot.pause()
+        warning_kwargs = mock_notify.call_args_list[-1].kwargs
+        assert warning_kwargs["severity"] == "warning"
+        assert "WARNING: Heads up" in last_line_plain()
 
-            def record(message: str, *, severity: str, **_: object) -> None:
-                notifications.append((message, severity))
+    run(scenario())
 
-            app.notify = MagicMock(side_effect=record)
 
-            await app._prompt_add_source()
-            await pilot.pause()
+def test_prompt_add_source_cancel_shows_notification(viewer, monkeypatch) -> None:
+    pilot, run = viewer
+    app = pilot.app
+    monkeypatch.setattr(app, "push_screen", AsyncMock(return_value=None))
 
-            assert notifications
-            message, severity = notifications[-1]
-            assert "canceled" in message.lower()
-            assert severity == "information"
+    notifications: list[tuple[str, str]] = []
 
-    asyncio.run(scenario())
+    def record(message: str, *, severity: str, **_: object) -> None:
+        notifications.append((message, severity))
 
-
-def test_prompt_add_source_failure_without_messages_shows_fallback(monkeypatch) -> None:
+    monkeypatch.setattr(app, "notify", MagicMock(side_effect=record))
 
     async def scenario() -> None:
-        app = LogViewerApp()
-        async with app.run_test() as pilot:  # noqa: F841 - pilot kept for context management
-            app._source_manager = SourceManager([], [])
-            monkeypatch.setattr(app, "push_screen", AsyncMock(return_value="/tmp/missing"))
+        await app._prompt_add_source()
+        await pilot.pause()
+
+    run(scenario())
 
-            addition = SourceAddition(success=False, path=Path("/tmp/missing"), messages=[])
-            app._source_manager.add = MagicMock(return_value=addition)
+    assert notifications
+    message, severity = notifications[-1]
+    assert "canceled" in message.lower()
+    assert severity == "information"
 
-            notifications: list[tuple[str, str]] = []
 
-            def record(message: str, *, severity: str, **_: object) -> None:
-                notifications.append((message, severity))
+def test_prompt_add_source_failure_without_messages_shows_fallback(viewer, monkeypatch) -> None:
+    pilot, run = viewer
+    app = pilot.app
+    monkeypatch.setattr(app, "push_screen", AsyncMock(return_value="/tmp/missing"))
 
-            app.notify = MagicMock(side_effect=record)
+    addition = SourceAddition(success=False, path=Path("/tmp/missing"), messages=[])
+    app._source_manager.add = MagicMock(return_value=addition)
 
-            await app._prompt_add_source()
-            await pilot.pause()
+    notifications: list[tuple[str, str]] = []
+
+    def record(message: str, *, severity: str, **_: object) -> None:
+        notifications.append((message, severity))
+
+    monkeypatch.setattr(app, "notify", MagicMock(side_effect=record))
+
+    async def scenario() -> None:
+        await app._prompt_add_source()
+        await pilot.pause()
 
-            assert notifications
-            message, severity = notifications[-1]
-            assert "unable to add log source" in message.lower()
-            assert severity == "error"
+    run(scenario())
 
-    asyncio.run(scenario())
+    assert notifications
+    message, severity = notifications[-1]
+    assert "unable to add log source" in message.lower()
+    assert severity == "error"